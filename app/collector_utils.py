@@ -0,0 +1,157 @@
+"""Shared helpers for collector plugins: HTTP sessions, validator state and ingest payloads."""
+from __future__ import annotations
+
+from pathlib import Path
+from typing import IO, Any, Iterable, Iterator, Sequence
+import json
+import logging
+import xml.etree.ElementTree as ET
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from pydantic import TypeAdapter
+
+try:  # Optional fast JSON decoder for API responses.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:  # Optional C-based XML parser used for streaming feeds.
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None  # type: ignore
+
+from app.schemas import BulletinCreate
+
+logger = logging.getLogger(__name__)
+
+_BULLETIN_LIST_ADAPTER = TypeAdapter(list[BulletinCreate])
+
+
+def pooled_session(
+    *,
+    pool_connections: int = 4,
+    pool_maxsize: int = 16,
+    retries: int = 3,
+    status_forcelist: Iterable[int] | None = None,
+) -> requests.Session:
+    """Create a session with a keep-alive connection pool and retry/backoff for http(s).
+
+    Collectors call this only for sessions they create themselves; a session
+    passed in by the caller is used as-is.
+    """
+
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(
+            total=retries,
+            backoff_factor=0.3,
+            status_forcelist=tuple(status_forcelist) if status_forcelist else None,
+        ),
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def load_json(response: requests.Response) -> Any:
+    """Decode a JSON response straight from its bytes, skipping charset sniffing."""
+
+    if orjson is not None:
+        # orjson.JSONDecodeError subclasses ValueError, like the stdlib error.
+        return orjson.loads(response.content)
+    return json.loads(response.content)
+
+
+def decoded_stream(response: requests.Response) -> IO[bytes]:
+    """Return the body of a ``stream=True`` response as a file object.
+
+    urllib3 undoes any gzip/deflate transfer encoding while the body streams.
+    """
+
+    response.raw.decode_content = True
+    return response.raw
+
+
+def iter_xml_items(stream: IO[bytes], tag: str = "item") -> Iterator[ET.Element]:
+    """Yield ``tag`` elements (RSS ``<item>`` by default) as they are parsed, releasing each afterwards.
+
+    Malformed XML raises ``SyntaxError`` (ElementTree.ParseError or lxml's
+    XMLSyntaxError); entities are not resolved and no network access is made.
+    """
+
+    if etree is not None:
+        context = etree.iterparse(stream, events=("end",), tag=tag, resolve_entities=False, no_network=True)
+        for _, elem in context:
+            yield elem
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        return
+    for _, elem in ET.iterparse(stream, events=("end",)):
+        if elem.tag == tag:
+            yield elem
+            elem.clear()
+
+
+def ingest_headers(token: str | None) -> dict[str, str]:
+    """Headers for the ingest POST.
+
+    They are passed per request rather than set on the collector's session, so
+    the token is never sent to the upstream site.
+    """
+
+    headers = {"Content-Type": "application/json", "Accept": "application/json"}
+    if token:
+        headers["Authorization"] = f"Bearer {token}"
+    return headers
+
+
+def load_validators(path: Path | None) -> dict[str, Any]:
+    """Load stored HTTP validators (ETag / Last-Modified) from ``path``.
+
+    Returns an empty mapping when ``path`` is None, missing or unreadable.
+    """
+
+    if path is None:
+        return {}
+    try:
+        validators = json.loads(path.read_bytes())
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning("Ignoring invalid validators file %s: %s", path, exc)
+        return {}
+    return validators if isinstance(validators, dict) else {}
+
+
+def save_validators(path: Path | None, validators: dict[str, Any]) -> None:
+    """Persist HTTP validators to ``path``; failures are logged, not raised."""
+
+    if path is None:
+        return
+    try:
+        path.write_text(json.dumps(validators), encoding="utf-8")
+    except OSError as exc:
+        logger.warning("Failed to save validators file %s: %s", path, exc)
+
+
+def encode_bulletins(bulletins: Sequence[BulletinCreate], *, exclude_none: bool = False) -> bytes:
+    """Serialize bulletins for the ingest API in a single pydantic-core pass."""
+
+    return _BULLETIN_LIST_ADAPTER.dump_json(list(bulletins), exclude_none=exclude_none)
+
+
+__all__ = [
+    "decoded_stream",
+    "encode_bulletins",
+    "ingest_headers",
+    "iter_xml_items",
+    "load_json",
+    "load_validators",
+    "pooled_session",
+    "save_validators",
+]
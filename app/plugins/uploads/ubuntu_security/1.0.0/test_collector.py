@@ -1,11 +1,14 @@
 """Tests for the Ubuntu security notice collector plugin."""
 from __future__ import annotations
 
+import io
 import json
+import os
 from pathlib import Path
 
 import pytest
 
+from resources.ubuntu_security_notice import collector as collector_module
 from resources.ubuntu_security_notice.collector import UbuntuSecurityCollector
 
 FIXTURE_DIR = Path(__file__).resolve().parent
@@ -14,10 +17,18 @@ DETAIL_URL = "https://ubuntu.com/security/notices/USN-7758-4.json"
 
 
 class MockResponse:
-    def __init__(self, *, text: str | None = None, json_data: dict | None = None, status_code: int = 200):
+    def __init__(
+        self,
+        *,
+        text: str | None = None,
+        json_data: dict | None = None,
+        status_code: int = 200,
+        headers: dict[str, str] | None = None,
+    ):
         self._text = text
         self._json = json_data
         self.status_code = status_code
+        self.headers = headers or {}
 
     def raise_for_status(self) -> None:
         if not (200 <= self.status_code < 300):
@@ -27,6 +38,19 @@ class MockResponse:
     def text(self) -> str:
         return self._text or ""
 
+    @property
+    def content(self) -> bytes:
+        if self._json is not None:
+            return json.dumps(self._json).encode("utf-8")
+        return self.text.encode("utf-8")
+
+    @property
+    def raw(self) -> io.BytesIO:
+        return io.BytesIO(self.content)
+
+    def close(self) -> None:
+        pass
+
     def json(self) -> dict:
         if self._json is None:
             raise RuntimeError("JSON requested but not available")
@@ -38,8 +62,16 @@ class FakeSession:
     def __init__(self, responses: dict[str, MockResponse]):
         self._responses = responses
         self.headers: dict[str, str] = {}
-
-    def get(self, url: str, timeout: int = 30) -> MockResponse:
+        self.request_headers: dict[str, dict[str, str]] = {}
+
+    def get(
+        self,
+        url: str,
+        timeout: int = 30,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> MockResponse:
+        self.request_headers[url] = headers or {}
         try:
             return self._responses[url]
         except KeyError as exc:
@@ -97,3 +129,77 @@ def test_cursor_prevents_duplicate_fetches(tmp_path, feed_text, detail_payload):
     collector_second = UbuntuSecurityCollector(session=session_second, state_path=state_path)
     second_run = collector_second.collect(limit=1, force=False)
     assert second_run == []
+
+
+def test_detail_cache_skips_refetch(tmp_path, feed_text, detail_payload):
+    state_path = tmp_path / "cursor.txt"
+    session_first = FakeSession(
+        {
+            FEED_URL: MockResponse(text=feed_text),
+            DETAIL_URL: MockResponse(json_data=detail_payload),
+        }
+    )
+    first_run = UbuntuSecurityCollector(session=session_first, state_path=state_path).collect(limit=1, force=True)
+    assert (tmp_path / "detail_cache" / "USN-7758-4.json").exists()
+
+    session_second = FakeSession({FEED_URL: MockResponse(text=feed_text)})
+    second_run = UbuntuSecurityCollector(session=session_second, state_path=state_path).collect(limit=1, force=True)
+    assert [b.raw for b in second_run] == [b.raw for b in first_run]
+
+    refreshing = UbuntuSecurityCollector(session=session_second, state_path=state_path, force_refresh=True)
+    with pytest.raises(AssertionError):
+        refreshing.collect(limit=1, force=True)
+
+
+def test_detail_cache_is_pruned_to_limit(tmp_path, monkeypatch, feed_text, detail_payload):
+    session = FakeSession(
+        {
+            FEED_URL: MockResponse(text=feed_text),
+            DETAIL_URL: MockResponse(json_data=detail_payload),
+        }
+    )
+    collector = UbuntuSecurityCollector(session=session, state_path=tmp_path / "cursor.txt")
+    collector.detail_cache_dir.mkdir()
+    for index in range(3):
+        stale = collector.detail_cache_dir / f"USN-OLD-{index}.json"
+        stale.write_text("{}", encoding="utf-8")
+        os.utime(stale, (index, index))
+    monkeypatch.setattr(collector_module, "DETAIL_CACHE_LIMIT", 2)
+
+    collector.collect(limit=1)
+
+    assert len(list(collector.detail_cache_dir.glob("*.json"))) == 2
+    assert (collector.detail_cache_dir / "USN-7758-4.json").exists()
+
+
+def test_normalize_without_detail_date_keeps_feed_date(tmp_path, feed_text, detail_payload):
+    session = FakeSession({FEED_URL: MockResponse(text=feed_text)})
+    collector = UbuntuSecurityCollector(session=session, state_path=tmp_path / "cursor.txt")
+    entry = next(entry for entry in collector.fetch_feed() if entry.notice_id == "USN-7758-4")
+    detail_payload.pop("published", None)
+
+    bulletin = collector.normalize(entry, detail_payload)
+
+    assert bulletin.content.published_at == entry.published_at
+
+
+def test_skip_leading_whitespace_replays_rest_of_stream():
+    payload = io.BytesIO(b"\n\n  <?xml version='1.0'?><rss/>")
+    stream = collector_module._skip_leading_whitespace(payload, chunk_size=3)
+    assert stream.read(2) == b"<?"
+    assert stream.read() == b"xml version='1.0'?><rss/>"
+
+
+def test_feed_not_modified_skips_parsing(tmp_path, feed_text, detail_payload):
+    state_path = tmp_path / "cursor.txt"
+    first_session = FakeSession(
+        {
+            FEED_URL: MockResponse(text=feed_text, headers={"ETag": '"feed-v1"'}),
+            DETAIL_URL: MockResponse(json_data=detail_payload),
+        }
+    )
+    assert UbuntuSecurityCollector(session=first_session, state_path=state_path).collect(limit=1)
+
+    second_session = FakeSession({FEED_URL: MockResponse(status_code=304)})
+    assert UbuntuSecurityCollector(session=second_session, state_path=state_path).collect(limit=1) == []
+    assert second_session.request_headers[FEED_URL]["If-None-Match"] == '"feed-v1"'
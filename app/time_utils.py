@@ -144,7 +144,10 @@ def _normalise_iso(text: str) -> str:
     return stripped
 
 
+@lru_cache(maxsize=4096)
 def _parse_datetime_string(text: str) -> Optional[datetime]:
+    """Parse a timestamp string; memoised because feeds repeat the same dates heavily."""
+
     stripped = text.strip()
     if not stripped:
         return None
@@ -170,13 +173,10 @@ def _parse_candidate(value: Any, label: str) -> Optional[_ParsedCandidate]:
     if value is None:
         return None
     raw = value
-    if isinstance(value, datetime):
-        had_tz = value.tzinfo is not None
-        return _ParsedCandidate(value=value, had_timezone=had_tz, date_only=False, raw=raw, label=label)
-    if isinstance(value, (int, float)):
-        dt = _parse_timestamp(value)
-        return _ParsedCandidate(value=dt, had_timezone=True, date_only=False, raw=raw, label=label)
-    if isinstance(value, str):
+    # Candidates come from JSON/XML parsers, so exact type checks cover the hot
+    # string path without walking the MRO; datetimes keep the isinstance check.
+    value_type = type(value)
+    if value_type is str:
         txt = value.strip()
         if not txt:
             return None
@@ -193,6 +193,12 @@ def _parse_candidate(value: Any, label: str) -> Optional[_ParsedCandidate]:
             raw=txt,
             label=label,
         )
+    if value_type is int or value_type is float:
+        dt = _parse_timestamp(value)
+        return _ParsedCandidate(value=dt, had_timezone=True, date_only=False, raw=raw, label=label)
+    if isinstance(value, datetime):
+        had_tz = value.tzinfo is not None
+        return _ParsedCandidate(value=value, had_timezone=had_tz, date_only=False, raw=raw, label=label)
     return None
 
 
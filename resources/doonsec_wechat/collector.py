@@ -10,6 +10,7 @@ import xml.etree.ElementTree as ET
 
 import requests
 
+from app.collector_utils import encode_bulletins, ingest_headers, pooled_session
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
@@ -20,11 +21,11 @@ REQUEST_HEADERS = {
     "User-Agent": USER_AGENT,
 }
 
-_HEX_ESCAPE_RE = re.compile(r"\\x([0-9A-Fa-f]{2})")
-_UNICODE_ESCAPE_RE = re.compile(r"\\u([0-9A-Fa-f]{4})")
+_HEX_ESCAPE_RE = re.compile(r"\\x([0-9A-Fa-f]{2})", re.ASCII)
+_UNICODE_ESCAPE_RE = re.compile(r"\\u([0-9A-Fa-f]{4})", re.ASCII)
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FetchParams:
     feed_url: str = DEFAULT_FEED_URL
     limit: int | None = None
@@ -37,6 +38,13 @@ def _trim(text: str | None) -> str | None:
     return cleaned or None
 
 
+def _escape_repl(match: re.Match[str]) -> str:
+    try:
+        return chr(int(match.group(1), 16))
+    except ValueError:
+        return match.group(0)
+
+
 def _clean_text(value: str | None) -> str | None:
     """Normalize backslash-escaped characters and HTML entities."""
 
@@ -46,21 +54,8 @@ def _clean_text(value: str | None) -> str | None:
     cleaned = value
     if "\\" in cleaned:
         cleaned = cleaned.replace('\\"', '"').replace("\\'", "'")
-
-        def _hex_repl(match: re.Match[str]) -> str:
-            try:
-                return chr(int(match.group(1), 16))
-            except ValueError:
-                return match.group(0)
-
-        def _unicode_repl(match: re.Match[str]) -> str:
-            try:
-                return chr(int(match.group(1), 16))
-            except ValueError:
-                return match.group(0)
-
-        cleaned = _HEX_ESCAPE_RE.sub(_hex_repl, cleaned)
-        cleaned = _UNICODE_ESCAPE_RE.sub(_unicode_repl, cleaned)
+        cleaned = _HEX_ESCAPE_RE.sub(_escape_repl, cleaned)
+        cleaned = _UNICODE_ESCAPE_RE.sub(_escape_repl, cleaned)
         cleaned = cleaned.replace("\\n", "\n").replace("\\t", "\t").replace("\\r", "\r")
         cleaned = cleaned.replace("\\\\", "\\")
 
@@ -71,7 +66,9 @@ class DoonsecCollector:
     """Collect and normalize Doonsec WeChat feed entries."""
 
     def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+        self.session = session or pooled_session(
+            pool_connections=2, pool_maxsize=10, status_forcelist=(502, 503, 504)
+        )
         self.session.headers.update(REQUEST_HEADERS)
 
     def fetch(self, params: FetchParams) -> Sequence[dict]:
@@ -99,8 +96,8 @@ class DoonsecCollector:
             "raw_xml": ET.tostring(item, encoding="unicode"),
         }
 
-    def normalize(self, item: dict) -> BulletinCreate:
-        fetched_at = datetime.now(timezone.utc)
+    def normalize(self, item: dict, fetched_at: datetime | None = None) -> BulletinCreate:
+        fetched_at = fetched_at or datetime.now(timezone.utc)
         published_at, time_meta = resolve_published_at(
             "doonsec_wechat",
             [(item.get("pub_date"), "item.pubDate")],
@@ -126,11 +123,14 @@ class DoonsecCollector:
             language="zh",
         )
 
-        labels: list[str] = []
-        if category:
-            labels.append(f"category:{category.lower()}")
-        if author:
-            labels.append(f"author:{author.lower()}")
+        labels = [
+            label
+            for label in (
+                "category:" + category.lower() if category else None,
+                "author:" + author.lower() if author else None,
+            )
+            if label
+        ]
         topics = ["security-news"]
 
         extra = {
@@ -139,9 +139,7 @@ class DoonsecCollector:
         }
         if time_meta:
             extra["time_meta"] = time_meta
-        raw_payload = {k: v for k, v in item.items() if k != "raw_xml"}
-        if item.get("raw_xml"):
-            raw_payload["raw_xml"] = item["raw_xml"]
+        raw_payload = item.copy()
 
         return BulletinCreate(
             source=source,
@@ -157,7 +155,8 @@ class DoonsecCollector:
     def collect(self, params: FetchParams | None = None) -> List[BulletinCreate]:
         params = params or FetchParams()
         entries = self.fetch(params)
-        return [self.normalize(entry) for entry in entries]
+        fetched_at = datetime.now(timezone.utc)
+        return [self.normalize(entry, fetched_at) for entry in entries]
 
 
 def run(
@@ -169,13 +168,9 @@ def run(
     bulletins = collector.collect(params=params)
     response_data = None
     if ingest_url and bulletins:
-        session = requests.Session()
-        headers = {"Content-Type": "application/json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        response = session.post(ingest_url, json=payload, timeout=30)
+        headers = ingest_headers(token)
+        body = encode_bulletins(bulletins, exclude_none=True)
+        response = collector.session.post(ingest_url, data=body, headers=headers, timeout=30)
         response.raise_for_status()
         response_data = response.json()
     return bulletins, response_data
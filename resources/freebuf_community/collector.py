@@ -5,11 +5,13 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import List, Sequence
+import heapq
 import logging
 import xml.etree.ElementTree as ET
 
 import requests
 
+from app.collector_utils import encode_bulletins
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
@@ -21,7 +23,7 @@ DEFAULT_LIMIT = 40
 DEFAULT_TOPIC = "security_news"
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FeedEntry:
     slug: str
     title: str
@@ -136,7 +138,7 @@ class FreeBufCollector:
             language="zh",
         )
 
-        labels = [f"category:{cat.lower()}" for cat in entry.categories]
+        labels = ["category:" + cat for cat in map(str.lower, entry.categories)]
         topics = [DEFAULT_TOPIC]
 
         extra: dict[str, object] = {}
@@ -170,15 +172,19 @@ class FreeBufCollector:
     def collect(self, *, limit: int | None = None, force: bool = False) -> List[BulletinCreate]:
         limit = limit or DEFAULT_LIMIT
         cursor = None if force else self.load_cursor()
-        entries = list(self.fetch_feed())
-        entries.sort(key=lambda item: item.published_at or datetime.min.replace(tzinfo=timezone.utc))
-
-        selected: list[FeedEntry] = []
-        for entry in entries:
-            if cursor and entry.published_at and entry.published_at <= cursor:
-                continue
-            selected.append(entry)
-        selected = selected[-limit:]
+        entries = self.fetch_feed()
+        min_dt = datetime.min.replace(tzinfo=timezone.utc)
+        candidates = (
+            (entry.published_at or min_dt, index, entry)
+            for index, entry in enumerate(entries)
+            if not (cursor and entry.published_at and entry.published_at <= cursor)
+        )
+        # Only the newest ``limit`` entries are kept, so a bounded heap avoids
+        # sorting the whole feed; reverse to restore chronological order.
+        # The feed index breaks ties exactly like the previous stable sort did.
+        newest = heapq.nlargest(limit, candidates, key=lambda candidate: candidate[:2])
+        newest.reverse()
+        selected = [entry for _, _, entry in newest]
 
         bulletins = [self.normalize(entry) for entry in selected]
         if bulletins and selected[-1].published_at:
@@ -201,8 +207,8 @@ def run(
         if token:
             headers["Authorization"] = f"Bearer {token}"
         session.headers.update(headers)
-        payload = [item.model_dump(mode="json") for item in bulletins]
-        response = session.post(ingest_url, json=payload, timeout=30)
+        body = encode_bulletins(bulletins, exclude_none=True)
+        response = session.post(ingest_url, data=body, timeout=30)
         response.raise_for_status()
         response_data = response.json()
     return bulletins, response_data
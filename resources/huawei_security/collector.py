@@ -3,10 +3,11 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from typing import Any, Iterable, List, Sequence
 
 import requests
 
+from app.collector_utils import encode_bulletins, load_json, pooled_session
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
@@ -21,6 +22,29 @@ DEFAULT_HEADERS = {
     "User-Agent": USER_AGENT,
 }
 
+TITLE_KEYS = ("advisoryTitle", "title", "name", "sasnTitle")
+URL_KEYS = ("advisoryUrl", "url", "allPath")
+SUMMARY_KEYS = ("summary", "overview", "description")
+BODY_KEYS = ("content", "details")
+SEVERITY_KEYS = ("severity", "level")
+ADVISORY_TYPE_KEYS = ("advisoryType", "type")
+CVE_KEYS = ("cveIds", "cveList")
+EXTERNAL_ID_KEYS = ("advisoryNo", "id", "docId", "sasnNo")
+LANGUAGE_KEYS = ("lang", "language")
+PUBLISHED_FIELDS = tuple(
+    (key, f"item.{key}")
+    for key in ("publishTime", "pubTime", "publishDate", "releaseTime", "releaseDate")
+)
+
+
+def _first(item: dict, keys: Sequence[str]) -> Any:
+    """Return the first truthy value among ``keys`` in ``item``."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
 
 @dataclass
 class FetchParams:
@@ -39,10 +63,11 @@ class HuaweiCollector:
     """Fetch and normalize Huawei enterprise security advisories."""
 
     def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+        self.session = session or pooled_session()
         self.session.headers.update(DEFAULT_HEADERS)
 
     def fetch(self, params: FetchParams) -> Sequence[dict]:
+        """Return freshly decoded advisory records; ``normalize`` may mutate them."""
         payload = {
             "keyword": params.keyword,
             "publishDateFrom": params.publish_date_from,
@@ -62,7 +87,7 @@ class HuaweiCollector:
         query = {"pageIndex": params.page_index, "pageSize": params.page_size}
         response = self.session.post(API_URL, params=query, json=payload, timeout=30)
         response.raise_for_status()
-        body = response.json()
+        body = load_json(response)
         data = body.get("data")
         if isinstance(data, list):
             return data
@@ -77,49 +102,34 @@ class HuaweiCollector:
                 return records
         return []
 
-    def normalize(self, item: dict) -> BulletinCreate:
-        title = (
-            item.get("advisoryTitle")
-            or item.get("title")
-            or item.get("name")
-            or item.get("sasnTitle")
-            or ""
-        )
-        origin_url = item.get("advisoryUrl") or item.get("url") or item.get("allPath")
-        summary = item.get("summary") or item.get("overview") or item.get("description")
-        body_text = item.get("content") or item.get("details") or summary
-        fetched_at = datetime.now(timezone.utc)
+    def normalize(self, item: dict, *, fetched_at: datetime | None = None) -> BulletinCreate:
+        title = _first(item, TITLE_KEYS) or ""
+        origin_url = _first(item, URL_KEYS)
+        summary = _first(item, SUMMARY_KEYS)
+        body_text = _first(item, BODY_KEYS) or summary
+        fetched_at = fetched_at or datetime.now(timezone.utc)
         published_at, time_meta = resolve_published_at(
             "huawei_security",
-            [
-                (item.get("publishTime"), "item.publishTime"),
-                (item.get("pubTime"), "item.pubTime"),
-                (item.get("publishDate"), "item.publishDate"),
-                (item.get("releaseTime"), "item.releaseTime"),
-                (item.get("releaseDate"), "item.releaseDate"),
-            ],
+            [(item.get(key), label) for key, label in PUBLISHED_FIELDS],
             fetched_at=fetched_at,
         )
-        severity = item.get("severity") or item.get("level")
+        severity = _first(item, SEVERITY_KEYS)
+        language = _first(item, LANGUAGE_KEYS)
+        vul_list = item.get("vul")
         labels: list[str] = []
-        advisory_type = item.get("advisoryType") or item.get("type")
+        advisory_type = _first(item, ADVISORY_TYPE_KEYS)
         if advisory_type:
             labels.append(str(advisory_type))
         topics = ["official_bulletin"]
-        cve_ids = item.get("cveIds") or item.get("cveList")
-        if not cve_ids and isinstance(item.get("vul"), list):
-            cve_ids = [entry.get("cveId") for entry in item["vul"] if entry.get("cveId")]
+        cve_ids = _first(item, CVE_KEYS)
+        if not cve_ids and isinstance(vul_list, list):
+            cve_ids = [entry.get("cveId") for entry in vul_list if entry.get("cveId")]
         if isinstance(cve_ids, str):
             cve_ids = [c.strip() for c in cve_ids.split(",") if c.strip()]
         if not isinstance(cve_ids, list):
             cve_ids = []
 
-        external_id = (
-            item.get("advisoryNo")
-            or item.get("id")
-            or item.get("docId")
-            or item.get("sasnNo")
-        )
+        external_id = _first(item, EXTERNAL_ID_KEYS)
         if external_id is not None:
             external_id = str(external_id).strip() or None
 
@@ -133,7 +143,7 @@ class HuaweiCollector:
             summary=summary,
             body_text=body_text,
             published_at=published_at,
-            language=item.get("lang") or item.get("language") or "en",
+            language=language or "en",
         )
         normalized_labels = [label for label in labels if label]
         if cve_ids:
@@ -145,17 +155,19 @@ class HuaweiCollector:
             "sasn_no": item.get("sasnNo"),
             "sasn_version": item.get("sasnVersion"),
             "severity": severity,
-            "language": item.get("lang") or item.get("language"),
+            "language": language,
         }
-        hw_ids = [entry.get("hwPsirtId") for entry in item.get("vul", []) if isinstance(entry, dict) and entry.get("hwPsirtId")]
+        hw_ids = [entry.get("hwPsirtId") for entry in vul_list or () if isinstance(entry, dict) and entry.get("hwPsirtId")]
         if hw_ids:
             extra["hw_psirt_ids"] = hw_ids
-        if item.get("vul"):
-            extra["vulnerabilities"] = item.get("vul")
+        if vul_list:
+            extra["vulnerabilities"] = vul_list
         if time_meta:
             extra["time_meta"] = time_meta
 
-        raw = dict(item)
+        # ``item`` comes straight from ``fetch`` and is owned by the collector,
+        # so it is used as the raw payload without copying.
+        raw = item
         if cve_ids:
             raw.setdefault("cveIds", cve_ids)
 
@@ -173,7 +185,8 @@ class HuaweiCollector:
     def collect(self, params: FetchParams | None = None) -> List[BulletinCreate]:
         params = params or FetchParams()
         items = self.fetch(params)
-        return [self.normalize(item) for item in items]
+        fetched_at = datetime.now(timezone.utc)
+        return [self.normalize(item, fetched_at=fetched_at) for item in items]
 
 
 def run(
@@ -190,10 +203,9 @@ def run(
         if token:
             headers["Authorization"] = f"Bearer {token}"
         session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        response = session.post(ingest_url, json=payload, timeout=30)
+        response = session.post(ingest_url, data=encode_bulletins(bulletins), timeout=30)
         response.raise_for_status()
-        response_data = response.json()
+        response_data = load_json(response)
     return bulletins, response_data
 
 
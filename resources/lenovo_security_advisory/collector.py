@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Iterable, List, Sequence
+from pathlib import Path
+from typing import Iterable, Iterator, List, Sequence
 import json
 import logging
 import re
@@ -12,6 +15,12 @@ import re
 import requests
 from bs4 import BeautifulSoup
 
+try:  # Optional C-backed HTML parser; BeautifulSoup is used when it is missing.
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # pragma: no cover
+    HTMLParser = None  # type: ignore
+
+from app.collector_utils import encode_bulletins, load_json, load_validators, pooled_session, save_validators
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
@@ -26,22 +35,43 @@ DEFAULT_HEADERS = {
     "Referer": "https://newsupport.lenovo.com.cn/SecurityPolicy.html",
     "User-Agent": USER_AGENT,
 }
+DETAIL_FETCH_WORKERS = 8
+LIST_PAGES_IN_FLIGHT = 2
+DETAIL_CACHE_FILE_NAME = ".detail_cache.json"
+DETAIL_CACHE_LIMIT = 500
+LIST_VALIDATORS_FILE_NAME = ".list_validators.json"
+
+_SEVERITY_RE = re.compile(r"严重性(?:</a>)?：([高中低])")
+_SEVERITY_MAP = {"高": "high", "中": "medium", "低": "low"}
+_CVE_RE = re.compile(r"CVE-\d{4}-\d{4,7}", re.IGNORECASE)
+_DETAIL_ID_RE = re.compile(r"detail/(\d+)")
+
+
+def _extract_html_text(html_content: str) -> str:
+    """Return the visible text of ``html_content`` without script/style bodies."""
+    if HTMLParser is not None:
+        try:
+            tree = HTMLParser(html_content)
+            for node in tree.css("script, style"):
+                node.decompose()
+            root = tree.body or tree.root
+            return root.text(separator="\n", strip=True) if root else ""
+        except Exception as e:
+            logging.warning(f"selectolax failed to parse HTML content, using BeautifulSoup: {e}")
+
+    soup = BeautifulSoup(html_content, "html.parser")
+    for script in soup(["script", "style"]):
+        script.decompose()
+    return soup.get_text(separator="\n", strip=True)
 
 
 def _clean_html_content(html_content: str | None) -> str:
-    """Extract clean text from HTML content using BeautifulSoup, with fallback to original HTML."""
+    """Extract clean text from HTML content, with fallback to original HTML."""
     if not html_content:
         return ""
     
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text and clean it up
-        text = soup.get_text(separator="\n", strip=True)
+        text = _extract_html_text(html_content)
         
         # Clean up extra whitespace
         lines = [line.strip() for line in text.splitlines()]
@@ -66,12 +96,35 @@ class FetchParams:
 class LenovoCollector:
     """Fetch and normalize Lenovo product security advisories."""
 
-    def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        detail_cache_path: Path | None = None,
+        list_validators_path: Path | None = None,
+    ) -> None:
+        self.session = session or pooled_session(pool_connections=16)
+        # Detail payloads keyed by notice number and list timestamps, and the
+        # ETag/Last-Modified validators of each list page; both are disabled
+        # unless a path is given (run() uses files next to the plugin).
+        self.detail_cache_path = detail_cache_path
+        self.list_validators_path = list_validators_path
+        self._list_validators = self.load_list_validators()
         self.session.headers.update(DEFAULT_HEADERS)
 
     def fetch_list(self, params: FetchParams) -> Sequence[dict]:
-        """Fetch the list of security advisories from Lenovo API."""
+        """Fetch the list of security advisories from Lenovo API.
+
+        The returned dicts are freshly decoded and owned by the collector;
+        ``normalize`` attaches the detail payload to them in place. Pages the
+        server reports as unchanged (304 Not Modified) yield no items.
+        """
+        page_key = f"{params.order_way}:{params.page_index}:{params.page_size}"
+        etag, last_modified = self._list_validators.get(page_key) or (None, None)
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
         response = self.session.get(
             API_BASE_URL,
             params={
@@ -79,10 +132,17 @@ class LenovoCollector:
                 "page_index": params.page_index,
                 "page_size": params.page_size,
             },
+            headers=headers or None,
             timeout=30
         )
+        if response.status_code == 304:
+            return []
         response.raise_for_status()
-        body = response.json()
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if etag or last_modified:
+            self._list_validators[page_key] = [etag, last_modified]
+        body = load_json(response)
         
         data = body.get("data")
         if isinstance(data, dict):
@@ -105,7 +165,7 @@ class LenovoCollector:
                 timeout=30
             )
             response.raise_for_status()
-            body = response.json()
+            body = load_json(response)
             if body.get("code") == 200:
                 return body.get("data")
         except Exception as e:
@@ -116,26 +176,94 @@ class LenovoCollector:
     def extract_knowledge_no_from_url(self, url: str) -> str | None:
         """Extract knowledge number from the notice_link URL."""
         # Example URL: https://iknow.lenovo.com.cn/detail/431977?type=undefined&keyword=431977&keyWordId=
-        match = re.search(r'detail/(\d+)', url)
+        match = _DETAIL_ID_RE.search(url)
         if match:
             return match.group(1)
         return None
 
-    def normalize(self, item: dict) -> BulletinCreate:
-        """Normalize API response item to BulletinCreate model."""
-        fetched_at = datetime.now(timezone.utc)
+    def load_detail_cache(self) -> dict[str, dict]:
+        """Load cached detail payloads from the cache file, if enabled."""
+        if self.detail_cache_path is None:
+            return {}
+        try:
+            cache = json.loads(self.detail_cache_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logging.warning(f"Invalid detail cache file content: {e}")
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def save_detail_cache(self, cache: dict[str, dict]) -> None:
+        """Persist the most recent detail payloads to the cache file, if enabled."""
+        if self.detail_cache_path is None:
+            return
+        if len(cache) > DETAIL_CACHE_LIMIT:
+            cache = dict(list(cache.items())[-DETAIL_CACHE_LIMIT:])
+        try:
+            self.detail_cache_path.write_text(json.dumps(cache, ensure_ascii=False), encoding="utf-8")
+        except Exception as e:
+            logging.error(f"Failed to save detail cache file: {e}")
+
+    def load_list_validators(self) -> dict[str, list[str | None]]:
+        """Load stored list page validators from state file, if enabled."""
+        return load_validators(self.list_validators_path)
+
+    def save_list_validators(self) -> None:
+        """Persist list page validators to state file, if enabled."""
+        save_validators(self.list_validators_path, self._list_validators)
+
+    @staticmethod
+    def _detail_cache_key(item: dict) -> str | None:
+        """Key a list item by its notice number and change timestamps."""
+        notice_number = item.get("notice_number")
+        if not notice_number:
+            return None
+        return "|".join(str(item.get(field) or "") for field in ("notice_number", "updated_at", "last_at"))
+
+    def _prefetch_details(self, items: Sequence[dict]) -> list[dict | None]:
+        """Fetch advisory details concurrently, returning results aligned with ``items``.
+
+        Details of items whose notice number and timestamps are unchanged since
+        a previous run are served from the detail cache without a request.
+        """
+        knowledge_nos = [
+            self.extract_knowledge_no_from_url(item.get("notice_link", "")) for item in items
+        ]
+        cache = self.load_detail_cache()
+        cache_keys = [self._detail_cache_key(item) for item in items]
+        details: list[dict | None] = [cache.get(key) if key else None for key in cache_keys]
+        pending = [
+            index
+            for index, (knowledge_no, detail) in enumerate(zip(knowledge_nos, details))
+            if knowledge_no and detail is None
+        ]
+        if not pending:
+            return details
+
+        with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(pending))) as executor:
+            fetched = list(executor.map(self.fetch_detail, [knowledge_nos[index] for index in pending]))
+        for index, detail in zip(pending, fetched):
+            details[index] = detail
+            if detail and cache_keys[index]:
+                cache[cache_keys[index]] = detail
+        self.save_detail_cache(cache)
+        return details
+
+    def normalize(
+        self,
+        item: dict,
+        detail_data: dict | None = None,
+        *,
+        fetched_at: datetime | None = None,
+    ) -> BulletinCreate:
+        """Normalize API response item (plus its prefetched detail) to BulletinCreate model."""
+        fetched_at = fetched_at or datetime.now(timezone.utc)
         
-        # Extract knowledge number from notice_link for fetching details
         notice_link = item.get("notice_link", "")
-        knowledge_no = self.extract_knowledge_no_from_url(notice_link)
-        
-        # Get detailed content
-        detail_data = None
         content_html = ""
-        if knowledge_no:
-            detail_data = self.fetch_detail(knowledge_no)
-            if detail_data:
-                content_html = detail_data.get("content", "")
+        if detail_data:
+            content_html = detail_data.get("content", "")
         
         # Extract title - prefer detailed title if available
         title = detail_data.get("title", "") if detail_data else ""
@@ -172,26 +300,17 @@ class LenovoCollector:
             )
         
         # Parse CVE IDs
+        # Scan for well-formed IDs regardless of separator; dedupe in order
         cve_str = item.get("notice_cves", "")
-        cve_ids = []
-        if cve_str:
-            # Split by '、' or ',' and clean up
-            cve_candidates = re.split(r'[、,，]', cve_str)
-            for cve_candidate in cve_candidates:
-                cve_candidate = cve_candidate.strip()
-                if cve_candidate.upper().startswith('CVE-'):
-                    cve_ids.append(cve_candidate.upper())
+        cve_ids = list(dict.fromkeys(match.upper() for match in _CVE_RE.findall(cve_str or "")))
         
         # Extract severity from content if available
         severity = None
         if content_html:
-            # Look for severity in the HTML content
-            if "严重性：高" in content_html or "严重性</a>：高" in content_html:
-                severity = "high"
-            elif "严重性：中" in content_html or "严重性</a>：中" in content_html:
-                severity = "medium"
-            elif "严重性：低" in content_html or "严重性</a>：低" in content_html:
-                severity = "low"
+            # Look for severity in the HTML content with a single scan
+            match = _SEVERITY_RE.search(content_html)
+            if match:
+                severity = _SEVERITY_MAP[match.group(1)]
         
         origin_url = notice_link
         external_id = item.get("notice_number") or item.get("notice_code")
@@ -247,13 +366,14 @@ class LenovoCollector:
                 "sub_topic_name": detail_data.get("subTopicName"),
                 "keywords": detail_data.get("keyWords"),
                 "version_no": detail_data.get("versionNo"),
-                "html_content": content_html,  # Store original HTML for reference
             })
         
         if time_meta:
             extra["time_meta"] = time_meta
 
-        raw = dict(item)
+        # ``item`` comes straight from ``fetch_list`` and is owned by the
+        # collector, so it is used as the raw payload without copying.
+        raw = item
         if detail_data:
             raw["detail"] = detail_data
 
@@ -268,11 +388,35 @@ class LenovoCollector:
             raw=raw,
         )
 
+    def collect_pages(self, params_iter: Iterable[FetchParams]) -> Iterator[BulletinCreate]:
+        """Collect several list pages, overlapping list fetches with detail fan-out.
+
+        While the details of page k are fetched and normalized, the list
+        requests for the next ``LIST_PAGES_IN_FLIGHT`` pages already run in a
+        background thread. Bulletins are yielded in page order.
+        """
+        params_queue = iter(params_iter)
+        in_flight: deque[Future] = deque()
+        with ThreadPoolExecutor(max_workers=1) as list_executor:
+
+            def submit_next_page() -> None:
+                params = next(params_queue, None)
+                if params is not None:
+                    in_flight.append(list_executor.submit(self.fetch_list, params))
+
+            for _ in range(LIST_PAGES_IN_FLIGHT):
+                submit_next_page()
+            while in_flight:
+                items = in_flight.popleft().result()
+                submit_next_page()
+                details = self._prefetch_details(items)
+                fetched_at = datetime.now(timezone.utc)
+                for item, detail in zip(items, details):
+                    yield self.normalize(item, detail, fetched_at=fetched_at)
+
     def collect(self, params: FetchParams | None = None) -> List[BulletinCreate]:
         """Collect and normalize Lenovo security advisories."""
-        params = params or FetchParams()
-        items = self.fetch_list(params)
-        return [self.normalize(item) for item in items]
+        return list(self.collect_pages([params or FetchParams()]))
 
 
 def run(
@@ -282,7 +426,11 @@ def run(
 ) -> tuple[list[BulletinCreate], dict | None]:
     """Entry point for scheduler execution."""
     
-    collector = LenovoCollector()
+    plugin_dir = Path(__file__).resolve().parent
+    collector = LenovoCollector(
+        detail_cache_path=plugin_dir / DETAIL_CACHE_FILE_NAME,
+        list_validators_path=plugin_dir / LIST_VALIDATORS_FILE_NAME,
+    )
     bulletins = collector.collect(params=params)
     response_data = None
     if ingest_url:
@@ -291,10 +439,12 @@ def run(
         if token:
             headers["Authorization"] = f"Bearer {token}"
         session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        api_response = session.post(ingest_url, json=payload, timeout=30)
+        api_response = session.post(ingest_url, data=encode_bulletins(bulletins), timeout=30)
         api_response.raise_for_status()
-        response_data = api_response.json()
+        response_data = load_json(api_response)
+        # Lenovo has no cursor: only remember the list pages once their
+        # advisories are ingested, or a failed POST would be skipped as 304.
+        collector.save_list_validators()
     return bulletins, response_data
 
 
@@ -4,7 +4,7 @@ import pytest
 import json
 from unittest.mock import Mock, patch
 
-from resources.lenovo_security_advisory.collector import LenovoCollector, FetchParams, _clean_html_content
+from resources.lenovo_security_advisory.collector import LenovoCollector, FetchParams, _clean_html_content, run
 
 
 def test_fetch_list():
@@ -13,7 +13,7 @@ def test_fetch_list():
     
     # Mock the session.get call to return sample data
     mock_response = Mock()
-    mock_response.json.return_value = {
+    mock_response.content = json.dumps({
         "statusCode": 200,
         "message": "success",
         "data": {
@@ -32,8 +32,10 @@ def test_fetch_list():
                 }
             ]
         }
-    }
+    }).encode()
     mock_response.raise_for_status.return_value = None
+    mock_response.status_code = 200
+    mock_response.headers = {}
     
     with patch.object(collector.session, 'get', return_value=mock_response):
         params = FetchParams(page_index=1, page_size=1)
@@ -59,7 +61,7 @@ def test_collect():
     
     # Mock the session.get call for the list API
     mock_list_response = Mock()
-    mock_list_response.json.return_value = {
+    mock_list_response.content = json.dumps({
         "statusCode": 200,
         "message": "success",
         "data": {
@@ -78,12 +80,14 @@ def test_collect():
                 }
             ]
         }
-    }
+    }).encode()
     mock_list_response.raise_for_status.return_value = None
+    mock_list_response.status_code = 200
+    mock_list_response.headers = {}
     
     # Mock the session.get call for the detail API
     mock_detail_response = Mock()
-    mock_detail_response.json.return_value = {
+    mock_detail_response.content = json.dumps({
         "code": 200,
         "msg": None,
         "data": {
@@ -97,8 +101,10 @@ def test_collect():
             "lineCategoryName": "Test Category",
             "keyWords": ["test", "advisory", "security"]
         }
-    }
+    }).encode()
     mock_detail_response.raise_for_status.return_value = None
+    mock_detail_response.status_code = 200
+    mock_detail_response.headers = {}
     
     with patch.object(collector.session, 'get', side_effect=[mock_list_response, mock_detail_response]):
         params = FetchParams(page_index=1, page_size=1)
@@ -118,9 +124,9 @@ def test_collect():
         assert "Test Title" in bulletin.content.body_text
         assert "Test content with" in bulletin.content.body_text
         assert "formatting" in bulletin.content.body_text
-        # Check that original HTML is preserved in extra
-        assert "html_content" in bulletin.extra
-        assert "<script>" in bulletin.extra["html_content"]
+        # Check that original HTML is kept once, in the raw detail payload
+        assert "html_content" not in bulletin.extra
+        assert "<script>" in bulletin.raw["detail"]["content"]
 
 
 def test_html_cleaning():
@@ -159,4 +165,138 @@ def test_html_cleaning():
     assert _clean_html_content("") == ""
     
     # Test fallback with invalid HTML
-    assert "fallback content" in _clean_html_content("fallback content")
\ No newline at end of file
+    assert "fallback content" in _clean_html_content("fallback content")
+
+
+def test_prefetch_details_aligns_with_items():
+    """Test concurrent detail prefetch keeps results aligned with list items."""
+    collector = LenovoCollector()
+    items = [
+        {"notice_link": "https://iknow.lenovo.com.cn/detail/111"},
+        {"notice_link": ""},
+        {"notice_link": "https://iknow.lenovo.com.cn/detail/333"},
+    ]
+
+    with patch.object(collector, "fetch_detail", side_effect=lambda no: {"knowledgeNo": no}):
+        details = collector._prefetch_details(items)
+
+    assert details == [{"knowledgeNo": "111"}, None, {"knowledgeNo": "333"}]
+
+
+def test_normalize_extracts_severity_from_detail_html():
+    """Test severity is read from the detail HTML in either markup variant."""
+    collector = LenovoCollector()
+    item = {
+        "notice_number": "LEN-1",
+        "notice_name": "Advisory",
+        "notice_link": "https://iknow.lenovo.com.cn/detail/1",
+    }
+
+    linked = collector.normalize(item, {"content": "<p><a href='#'>严重性</a>：中</p>"})
+    plain = collector.normalize(item, {"content": "<p>严重性：高</p>"})
+    missing = collector.normalize(item, {"content": "<p>No rating</p>"})
+
+    assert linked.severity == "medium"
+    assert plain.severity == "high"
+    assert missing.severity is None
+
+
+def test_prefetch_details_reuses_cache_for_unchanged_items(tmp_path):
+    """Test unchanged advisories are served from the detail cache on later runs."""
+    cache_path = tmp_path / "detail_cache.json"
+    items = [
+        {
+            "notice_number": "LEN-111",
+            "notice_link": "https://iknow.lenovo.com.cn/detail/111",
+            "last_at": "2023-10-10 10:00:00",
+        },
+    ]
+
+    first = LenovoCollector(detail_cache_path=cache_path)
+    with patch.object(first, "fetch_detail", return_value={"knowledgeNo": "111"}) as fetch:
+        assert first._prefetch_details(items) == [{"knowledgeNo": "111"}]
+    assert fetch.call_count == 1
+
+    second = LenovoCollector(detail_cache_path=cache_path)
+    with patch.object(second, "fetch_detail") as fetch:
+        assert second._prefetch_details(items) == [{"knowledgeNo": "111"}]
+        changed = [dict(items[0], last_at="2023-11-01 08:00:00")]
+        fetch.return_value = {"knowledgeNo": "111", "title": "Updated"}
+        assert second._prefetch_details(changed) == [{"knowledgeNo": "111", "title": "Updated"}]
+    assert fetch.call_count == 1
+
+
+def test_normalize_detects_cve_ids_with_any_separator():
+    """Test CVE IDs are recognised regardless of the separator used."""
+    collector = LenovoCollector()
+    item = {
+        "notice_number": "LEN-2",
+        "notice_name": "Advisory",
+        "notice_link": "https://iknow.lenovo.com.cn/detail/2",
+    }
+
+    with_cves = collector.normalize(dict(item, notice_cves="cve-2023-5678；CVE-2024-12345"))
+    without_cves = collector.normalize(dict(item, notice_cves="N/A"))
+
+    assert "cve" in with_cves.topics
+    assert "cve" not in without_cves.topics
+
+
+def test_collect_pages_preserves_page_order():
+    """Test pipelined page collection yields bulletins in page order."""
+    collector = LenovoCollector()
+
+    def fake_list(params):
+        return [
+            {
+                "notice_number": f"LEN-{params.page_index}-{index}",
+                "notice_name": "Advisory",
+                "notice_link": "https://iknow.lenovo.com.cn/detail/1",
+            }
+            for index in range(2)
+        ]
+
+    with patch.object(collector, "fetch_list", side_effect=fake_list), \
+            patch.object(collector, "fetch_detail", return_value=None):
+        pages = [FetchParams(page_index=index) for index in (1, 2, 3)]
+        bulletins = list(collector.collect_pages(pages))
+
+    assert [bulletin.source.external_id for bulletin in bulletins] == [
+        "LEN-1-0", "LEN-1-1", "LEN-2-0", "LEN-2-1", "LEN-3-0", "LEN-3-1",
+    ]
+
+
+def test_fetch_list_uses_conditional_get(tmp_path):
+    """Test list pages send stored validators and skip work on 304."""
+    validators_path = tmp_path / "validators.json"
+    collector = LenovoCollector(list_validators_path=validators_path)
+
+    fresh = Mock(status_code=200, headers={"ETag": '"v1"'})
+    fresh.content = json.dumps({"data": {"data": [{"notice_number": "LEN-1"}]}}).encode()
+    with patch.object(collector.session, "get", return_value=fresh):
+        assert collector.fetch_list(FetchParams()) == [{"notice_number": "LEN-1"}]
+    collector.save_list_validators()
+
+    reloaded = LenovoCollector(list_validators_path=validators_path)
+    with patch.object(reloaded.session, "get", return_value=Mock(status_code=304)) as get:
+        assert reloaded.fetch_list(FetchParams()) == []
+    assert get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_run_saves_list_validators_only_after_ingest():
+    """Test a failed ingest leaves the list validators untouched."""
+    failed = Mock()
+    failed.raise_for_status.side_effect = RuntimeError("ingest down")
+    with patch.object(LenovoCollector, "collect", return_value=[]), \
+            patch.object(LenovoCollector, "save_list_validators") as save, \
+            patch("requests.Session.post", return_value=failed):
+        with pytest.raises(RuntimeError):
+            run(ingest_url="http://ingest.local")
+    save.assert_not_called()
+
+    ok = Mock(content=b"{}")
+    with patch.object(LenovoCollector, "collect", return_value=[]), \
+            patch.object(LenovoCollector, "save_list_validators") as save, \
+            patch("requests.Session.post", return_value=ok):
+        run(ingest_url="http://ingest.local")
+    save.assert_called_once()
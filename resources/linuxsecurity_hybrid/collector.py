@@ -3,16 +3,32 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
 from typing import List, Sequence
 import xml.etree.ElementTree as ET
 
 import requests
 
+try:  # Optional lxml serializer for the raw <item> XML; ElementTree is the fallback.
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None  # type: ignore
+
+from app.collector_utils import (
+    decoded_stream,
+    encode_bulletins,
+    iter_xml_items,
+    load_validators,
+    pooled_session,
+    save_validators,
+)
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
 DEFAULT_FEED_URL = "https://linuxsecurity.com/linuxsecurity_hybrid.xml"
 USER_AGENT = "SecLensCollector/0.1"
+VALIDATORS_FILE_NAME = ".feed_validators.json"
 REQUEST_HEADERS = {
     "Accept": "application/rss+xml, application/xml;q=0.9, */*;q=0.8",
     "User-Agent": USER_AGENT,
@@ -34,31 +50,81 @@ def _trim(text: str | None) -> str | None:
 
 def _find_encoded(node: ET.Element) -> str | None:
     for child in node:
-        if child.tag.lower().endswith("encoded"):
+        if isinstance(child.tag, str) and child.tag.lower().endswith("encoded"):
             return _trim(child.text)
     return None
 
 
+@lru_cache(maxsize=512)
+def _resolve_published_at(pub_date: str | None, fetched_at: datetime) -> tuple[datetime | None, dict]:
+    """Resolve publication time, memoised per raw pubDate within a run."""
+    return resolve_published_at(
+        "linuxsecurity_hybrid",
+        [(pub_date, "item.pubDate")],
+        fetched_at=fetched_at,
+    )
+
+
+def _element_xml(elem: ET.Element) -> str:
+    if etree is not None:
+        return etree.tostring(elem, encoding="unicode", with_tail=False)
+    return ET.tostring(elem, encoding="unicode")
+
+
 class LinuxSecurityCollector:
     """Fetch and normalize LinuxSecurity.com RSS entries."""
 
-    def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        validators_path: Path | None = None,
+    ) -> None:
+        self.session = session or pooled_session(pool_connections=16, status_forcelist=(500, 502, 503, 504))
         self.session.headers.update(REQUEST_HEADERS)
+        # ETag/Last-Modified per feed URL; disabled unless a path is given
+        # (run() uses a file next to the plugin).
+        self.validators_path = validators_path
+        self._validators = self.load_validators()
 
-    def fetch(self, params: FetchParams) -> Sequence[dict]:
-        response = self.session.get(params.feed_url, timeout=30)
-        response.raise_for_status()
-        root = ET.fromstring(response.content)
-        channel = root.find("channel")
-        items = channel.findall("item") if channel is not None else root.findall(".//item")
+    def load_validators(self) -> dict[str, list[str | None]]:
+        """Load stored feed validators from state file, if enabled."""
+        return load_validators(self.validators_path)
+
+    def save_validators(self) -> None:
+        """Persist feed validators to state file, if enabled.
 
-        serialized: list[dict] = []
-        for item in items:
-            serialized.append(self._serialize_item(item))
-            if params.limit and len(serialized) >= params.limit:
-                break
-        return serialized
+        Called by run() after a successful ingest; this collector keeps no
+        cursor, so saving earlier would turn a failed ingest into a 304 that
+        skips the unsent items for good.
+        """
+        save_validators(self.validators_path, self._validators)
+
+    def fetch(self, params: FetchParams) -> Sequence[dict]:
+        """Fetch feed items; an unchanged feed (304 Not Modified) yields none."""
+        etag, last_modified = self._validators.get(params.feed_url) or (None, None)
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+        response = self.session.get(params.feed_url, headers=headers or None, stream=True, timeout=30)
+        try:
+            if response.status_code == 304:
+                return []
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            # A limited fetch leaves items unread, so it must not mark the feed as seen.
+            if (etag or last_modified) and not params.limit:
+                self._validators[params.feed_url] = [etag, last_modified]
+            serialized: list[dict] = []
+            for item in iter_xml_items(decoded_stream(response)):
+                serialized.append(self._serialize_item(item))
+                if params.limit and len(serialized) >= params.limit:
+                    break
+            return serialized
+        finally:
+            response.close()
 
     def _serialize_item(self, item: ET.Element) -> dict:
         guid_node = item.find("guid")
@@ -78,16 +144,12 @@ class LinuxSecurityCollector:
             "guid_attributes": dict(guid_node.attrib) if guid_node is not None else {},
             "pub_date": _trim(item.findtext("pubDate")),
             "categories": categories,
-            "raw_xml": ET.tostring(item, encoding="unicode"),
+            "raw_xml": _element_xml(item),
         }
 
-    def normalize(self, item: dict) -> BulletinCreate:
-        fetched_at = datetime.now(timezone.utc)
-        published_at, time_meta = resolve_published_at(
-            "linuxsecurity_hybrid",
-            [(item.get("pub_date"), "item.pubDate")],
-            fetched_at=fetched_at,
-        )
+    def normalize(self, item: dict, *, fetched_at: datetime | None = None) -> BulletinCreate:
+        fetched_at = fetched_at or datetime.now(timezone.utc)
+        published_at, time_meta = _resolve_published_at(item.get("pub_date"), fetched_at)
         origin_url = item.get("link")
         description = item.get("description")
         body_text = item.get("content_encoded") or description
@@ -116,15 +178,10 @@ class LinuxSecurityCollector:
             "guid_attributes": item.get("guid_attributes") or {},
         }
         if time_meta:
-            extra["time_meta"] = time_meta
+            extra["time_meta"] = dict(time_meta)
 
-        raw_payload = {
-            key: value
-            for key, value in item.items()
-            if key != "raw_xml"
-        }
-        if item.get("raw_xml"):
-            raw_payload["raw_xml"] = item["raw_xml"]
+        # fetch() builds each item dict fresh, so a shallow copy suffices.
+        raw_payload = dict(item)
 
         return BulletinCreate(
             source=source,
@@ -140,7 +197,8 @@ class LinuxSecurityCollector:
     def collect(self, params: FetchParams | None = None) -> List[BulletinCreate]:
         params = params or FetchParams()
         entries = self.fetch(params)
-        return [self.normalize(item) for item in entries]
+        fetched_at = datetime.now(timezone.utc)
+        return [self.normalize(item, fetched_at=fetched_at) for item in entries]
 
 
 def run(
@@ -148,7 +206,9 @@ def run(
     token: str | None = None,
     params: FetchParams | None = None,
 ) -> tuple[list[BulletinCreate], dict | None]:
-    collector = LinuxSecurityCollector()
+    collector = LinuxSecurityCollector(
+        validators_path=Path(__file__).resolve().with_name(VALIDATORS_FILE_NAME),
+    )
     bulletins = collector.collect(params=params)
     response_data = None
     if ingest_url and bulletins:
@@ -157,10 +217,11 @@ def run(
         if token:
             headers["Authorization"] = f"Bearer {token}"
         session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        response = session.post(ingest_url, json=payload, timeout=30)
+        response = session.post(ingest_url, data=encode_bulletins(bulletins), timeout=30)
         response.raise_for_status()
         response_data = response.json()
+        # Only remember the feed version once its items have been ingested.
+        collector.save_validators()
     return bulletins, response_data
 
 
@@ -2,25 +2,41 @@
 
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Iterable, List, Sequence
+import html
 import json
 import logging
 import re
 from urllib.parse import urlparse
 
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer, Tag
 
+try:  # Optional fast JSON codec for the cursor file.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:  # Optional C-based HTML parser; BeautifulSoup falls back to html.parser.
+    from lxml import etree as lxml_etree, html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    lxml_etree = lxml_html = None  # type: ignore
+
+from app.collector_utils import encode_bulletins, pooled_session
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
 API_BASE_URL = "https://www.nvidia.com/content/dam/en-zz/Solutions/product-security/product-security.json"
 USER_AGENT = "SecLensNVIDIACollector/1.0"
 STATE_FILE_NAME = ".nvidia_cursor"
+DETAIL_FETCH_WORKERS = 8
 LOGGER = logging.getLogger(__name__)
+HTML_PARSER = "lxml" if lxml_html is not None else "html.parser"
 
 DEFAULT_HEADERS = {
     "accept": "application/json, text/javascript, */*; q=0.01",
@@ -38,75 +54,156 @@ DEFAULT_HEADERS = {
     "x-requested-with": "XMLHttpRequest"
 }
 
+_HREF_RE = re.compile(r"""<a[^>]+href=['"]([^'"]+)['"]""", re.IGNORECASE)
+_TAG_RE = re.compile(r"<[^>]+>")
+# CVE lists are separated by commas/semicolons (ASCII or full-width) and whitespace.
+_CVE_SEP_RE = re.compile(r"[,;，；\s]+")
+_CVE_ID_RE = re.compile(r"CVE-\d{4}-\d{4,}$", re.IGNORECASE)
+# Custhelp pages only contribute their <title> and main column to a bulletin.
+_CUSTHELP_STRAINER = SoupStrainer(
+    lambda name, attrs: name == "title" or (name == "div" and attrs.get("id") == "rn_MainColumn")
+)
+_SEVERITY_MAP = {
+    "critical": "critical",
+    "high": "high",
+    "medium": "medium",
+    "moderate": "medium",
+    "low": "low",
+}
+
 
 def _clean_html_content(html_content: str | None) -> str:
-    """Extract clean text from HTML content using BeautifulSoup, with fallback to original HTML."""
-    if not html_content:
+    """Extract clean text from HTML content using lxml or BeautifulSoup, with fallback to original HTML."""
+    if not html_content or html_content.isspace():
         return ""
     
     try:
-        soup = BeautifulSoup(html_content, "html.parser")
-        
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
-        
-        # Get text and clean it up
-        text = soup.get_text(separator=" ", strip=True)
+        tree = None
+        if lxml_html is not None:
+            try:
+                tree = lxml_html.fromstring(html_content)
+            except (ValueError, lxml_etree.ParserError):
+                # e.g. a str carrying an XML encoding declaration; BeautifulSoup copes with it.
+                tree = None
+        if tree is not None:
+            # Drop comments, scripts and styles, then join text nodes in one C-level pass
+            lxml_etree.strip_elements(tree, lxml_etree.Comment, "script", "style", with_tail=False)
+            text = " ".join(tree.itertext())
+        else:
+            soup = BeautifulSoup(html_content, HTML_PARSER)
+            for script in soup(["script", "style"]):
+                script.decompose()
+            text = soup.get_text(separator=" ", strip=True)
         
         # Clean up extra whitespace
-        clean_text = ' '.join(text.split())
-        
-        return clean_text
+        return ' '.join(text.split())
     except Exception as e:
         logging.warning(f"Failed to clean HTML content: {e}")
         # Fallback to original HTML if cleaning fails
         return html_content
 
 
+def _clean_tag_text(tag: Tag) -> str:
+    """Extract clean text from an already parsed BeautifulSoup tag."""
+    for script in tag(["script", "style"]):
+        script.decompose()
+    return " ".join(tag.get_text(separator=" ", strip=True).split())
+
+
 def _extract_url_from_html_link(html_link: str) -> str | None:
     """Extract URL from HTML anchor tag."""
+    match = _HREF_RE.search(html_link or "")
+    return html.unescape(match.group(1)) if match else None
+
+
+def _markdown_title(content: str) -> str | None:
+    """Return the text of the first ``# `` heading line, located with ``str.find``."""
+    if content.startswith("# "):
+        start = 2
+    else:
+        start = content.find("\n# ")
+        if start == -1:
+            return None
+        start += 3
+    end = content.find("\n", start)
+    return content[start : end if end != -1 else None] or None
+
+
+@lru_cache(maxsize=512)
+def _parse_publish_year(publish_date: str | None) -> int | None:
+    """Year of an NVIDIA publish date such as ``"09 Oct 2025"``, or None when unparseable."""
     try:
-        soup = BeautifulSoup(html_link, "html.parser")
-        link_tag = soup.find("a")
-        if link_tag and link_tag.get("href"):
-            return link_tag["href"]
-    except Exception as e:
-        LOGGER.warning(f"Failed to extract URL from HTML link: {e}")
-    return None
+        return datetime.strptime((publish_date or "").strip(), "%d %b %Y").year
+    except ValueError:
+        return None
+
+
+def _publish_year(publish_date: str | None) -> int:
+    """Year of an NVIDIA publish date, defaulting to the current year."""
+    year = _parse_publish_year(publish_date)
+    return year if year is not None else datetime.now().year
+
+
+def _severity_level(severity: str | None) -> str | None:
+    """Map a severity label such as ``"High"`` or ``"High, Medium"`` to a normalized level."""
+    if not severity:
+        return None
+    severity_lower = severity.lower()
+    words = severity_lower.split(None, 1)
+    level = _SEVERITY_MAP.get(words[0]) if words else None
+    if level is not None:
+        return level
+    # Combined or decorated labels fall back to a scan in priority order.
+    return next((mapped for label, mapped in _SEVERITY_MAP.items() if label in severity_lower), None)
+
+
+@lru_cache(maxsize=512)
+def _resolve_published_at(
+    publish_date: str, last_updated: str, fetched_at: datetime
+) -> tuple[datetime | None, dict[str, Any]]:
+    """Resolve publication time, memoised because a batch shares dates and ``fetched_at``."""
+    return resolve_published_at(
+        "nvidia_security_bulletin",
+        [
+            (publish_date, "item.publish_date"),
+            (last_updated, "item.last_updated"),
+        ],
+        fetched_at=fetched_at,
+    )
 
 
 def _extract_cve_ids(cve_str: str | None) -> list[str]:
     """Extract CVE IDs from a string containing CVE identifiers."""
     if not cve_str:
         return []
-    
-    # Split by comma, semicolon, or other separators and clean up
-    cve_candidates = re.split(r'[,;，；]', cve_str)
-    cve_ids = []
-    
-    for cve_candidate in cve_candidates:
-        cve_candidate = cve_candidate.strip()
-        if cve_candidate.upper().startswith('CVE-'):
-            cve_ids.append(cve_candidate.upper())
-    
-    return cve_ids
+    return [token.upper() for token in _CVE_SEP_RE.split(cve_str) if _CVE_ID_RE.match(token)]
 
 
 class NVIDIACollector:
     """Fetch and normalize NVIDIA security bulletins."""
 
     def __init__(self, session: requests.Session | None = None, state_path: Path | None = None) -> None:
-        self.session = session or requests.Session()
+        # A caller-supplied session is used as-is; only our own one gets the pool.
+        self.session = session or pooled_session(pool_connections=16, status_forcelist=(500, 502, 503, 504))
         self.session.headers.update(DEFAULT_HEADERS)
         self.state_path = state_path or Path(__file__).resolve().with_name(STATE_FILE_NAME)
+        # Bulletin IDs GitHub answered 404 for during this run.
+        self._github_misses: set[str] = set()
+        # ETag/Last-Modified of the bulletin list, persisted in the cursor file.
+        self._list_validators: dict[str, str] = {}
 
     def load_cursor(self) -> set[str] | None:
-        """Load previously seen bulletin IDs from state file."""
+        """Load previously seen bulletin IDs (and list validators) from state file."""
         try:
-            content = self.state_path.read_text(encoding="utf-8").strip()
-            if content:
-                return set(json.loads(content))
+            content = self.state_path.read_bytes()
+            if content.strip():
+                state = orjson.loads(content) if orjson is not None else json.loads(content)
+                if isinstance(state, list):  # Cursor files written before validators were stored
+                    return set(state)
+                self._list_validators = {
+                    key: state[key] for key in ("etag", "last_modified") if state.get(key)
+                }
+                return set(state.get("seen") or ())
         except FileNotFoundError:
             pass
         except Exception as e:
@@ -114,16 +211,36 @@ class NVIDIACollector:
         return set()
 
     def save_cursor(self, bulletin_ids: set[str]) -> None:
-        """Save current set of bulletin IDs to state file."""
+        """Save current set of bulletin IDs and list validators to state file, sorted for stable diffs."""
+        state = {"seen": sorted(bulletin_ids), **self._list_validators}
         try:
-            self.state_path.write_text(json.dumps(list(bulletin_ids)), encoding="utf-8")
+            if orjson is not None:
+                self.state_path.write_bytes(orjson.dumps(state))
+            else:
+                self.state_path.write_text(json.dumps(state), encoding="utf-8")
         except Exception as e:
             LOGGER.error(f"Failed to save cursor file: {e}")
 
     def fetch_list(self) -> Sequence[dict]:
-        """Fetch the list of security bulletins from NVIDIA API."""
-        response = self.session.get(API_BASE_URL, timeout=30)
+        """Fetch the list of security bulletins from NVIDIA API.
+
+        The request is conditional on the validators loaded with the cursor; an
+        unchanged list (304 Not Modified) yields no items.
+        """
+        headers = {}
+        if self._list_validators.get("etag"):
+            headers["If-None-Match"] = self._list_validators["etag"]
+        if self._list_validators.get("last_modified"):
+            headers["If-Modified-Since"] = self._list_validators["last_modified"]
+        response = self.session.get(API_BASE_URL, headers=headers or None, timeout=30)
+        if response.status_code == 304:
+            return []
         response.raise_for_status()
+        validators = {
+            "etag": response.headers.get("ETag"),
+            "last_modified": response.headers.get("Last-Modified"),
+        }
+        self._list_validators = {key: value for key, value in validators.items() if value}
         body = response.json()
         
         data = body.get("data")
@@ -133,29 +250,24 @@ class NVIDIACollector:
                 
         return []
 
-    def fetch_github_detail(self, bulletin_id: str, publish_date: str) -> tuple[str, str] | None:
+    def fetch_github_detail(self, bulletin_id: str, year: int) -> tuple[str, str] | None:
         """
         Fetch detailed content from NVIDIA GitHub repository.
         Format: github.com/NVIDIA/product-security/blob/main/YYYY/bulletin_id/bulletin_id.md
         """
+        if bulletin_id in self._github_misses:
+            return None
         try:
-            # Extract year from publish date (format: "09 Oct 2025")
-            date_parts = publish_date.split()
-            if len(date_parts) >= 3:
-                year = date_parts[2]
-            else:
-                # Default to current year if parsing fails
-                year = str(datetime.now().year)
-            
             url = f"https://raw.githubusercontent.com/NVIDIA/product-security/main/{year}/{bulletin_id}/{bulletin_id}.md"
             response = self.session.get(url, timeout=30)
             
             if response.status_code == 200:
                 content = response.text
                 # Extract title from the markdown content if present
-                title_match = re.search(r'^# (.+)', content, re.MULTILINE)
-                title = title_match.group(1) if title_match else f"NVIDIA Security Bulletin {bulletin_id}"
+                title = _markdown_title(content) or f"NVIDIA Security Bulletin {bulletin_id}"
                 return title, content
+            if response.status_code == 404:
+                self._github_misses.add(bulletin_id)
         except Exception as e:
             LOGGER.debug(f"GitHub detail fetch failed for bulletin {bulletin_id}: {e}")
         
@@ -167,12 +279,12 @@ class NVIDIACollector:
             response = self.session.get(url, timeout=30)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, "html.parser")
+            soup = BeautifulSoup(response.text, HTML_PARSER, parse_only=_CUSTHELP_STRAINER)
             main_content_div = soup.find("div", id="rn_MainColumn", attrs={"role": "main"})
             
             if main_content_div:
-                # Extract the text content from the main div
-                content = _clean_html_content(str(main_content_div))
+                # Extract the text content from the main div without re-parsing it
+                content = _clean_tag_text(main_content_div)
                 
                 # Try to extract title from the page
                 title_tag = soup.find("title")
@@ -184,9 +296,35 @@ class NVIDIACollector:
         
         return None
 
-    def normalize(self, item: dict) -> BulletinCreate:
-        """Normalize API response item to BulletinCreate model."""
-        fetched_at = datetime.now(timezone.utc)
+    def fetch_detail(self, item: dict) -> tuple[str, str] | None:
+        """Fetch bulletin detail from GitHub, falling back to custhelp."""
+        bulletin_id = item.get("bulletin id", "")
+        if not bulletin_id:
+            return None
+        detail = self.fetch_github_detail(bulletin_id, _publish_year(item.get("publish date")))
+        if detail:
+            return detail
+        origin_url = _extract_url_from_html_link(item.get("title", ""))
+        if origin_url:
+            return self.fetch_custhelp_detail(origin_url)
+        return None
+
+    def _prefetch_details(self, items: Sequence[dict]) -> list[tuple[str, str] | None]:
+        """Fetch bulletin details concurrently, returning results aligned with ``items``."""
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(items))) as executor:
+            return list(executor.map(self.fetch_detail, items))
+
+    def normalize(
+        self,
+        item: dict,
+        detail: tuple[str, str] | None = None,
+        *,
+        fetched_at: datetime | None = None,
+    ) -> BulletinCreate:
+        """Normalize API response item (plus its prefetched detail) to BulletinCreate model."""
+        fetched_at = fetched_at or datetime.now(timezone.utc)
         
         bulletin_id = item.get("bulletin id", "")
         title_html = item.get("title", "")
@@ -199,39 +337,16 @@ class NVIDIACollector:
         origin_url = _extract_url_from_html_link(title_html)
         
         # Extract actual title from HTML
-        try:
-            soup = BeautifulSoup(title_html, "html.parser")
-            actual_title = soup.get_text().strip()
-        except:
-            actual_title = title_html.strip()
+        actual_title = html.unescape(_TAG_RE.sub("", title_html)).strip()
         
         # Parse publication time
-        published_at, time_meta = resolve_published_at(
-            "nvidia_security_bulletin",
-            [
-                (publish_date, "item.publish_date"),
-                (last_updated, "item.last_updated"),
-            ],
-            fetched_at=fetched_at,
-        )
+        published_at, time_meta = _resolve_published_at(publish_date, last_updated, fetched_at)
         
         # Parse CVE IDs
         cve_ids = _extract_cve_ids(cve_identifiers)
         
-        # Get detailed content from GitHub first, fallback to custhelp
-        detail_title = ""
-        detail_content = ""
-        
-        if bulletin_id:
-            # Try GitHub first
-            github_detail = self.fetch_github_detail(bulletin_id, publish_date)
-            if github_detail:
-                detail_title, detail_content = github_detail
-            elif origin_url:
-                # Fallback to custhelp.com
-                custhelp_detail = self.fetch_custhelp_detail(origin_url)
-                if custhelp_detail:
-                    detail_title, detail_content = custhelp_detail
+        # Detailed content comes from GitHub first, falling back to custhelp
+        detail_title, detail_content = detail or ("", "")
         
         # Use detail title if available, otherwise use the actual title from HTML
         final_title = detail_title if detail_title else actual_title
@@ -240,17 +355,7 @@ class NVIDIACollector:
         clean_content = _clean_html_content(detail_content)
         
         # Determine severity level
-        severity_level = None
-        if severity:
-            severity_lower = severity.lower()
-            if "critical" in severity_lower:
-                severity_level = "critical"
-            elif "high" in severity_lower:
-                severity_level = "high"
-            elif "medium" in severity_lower or "moderate" in severity_lower:
-                severity_level = "medium"
-            elif "low" in severity_lower:
-                severity_level = "low"
+        severity_level = _severity_level(severity)
         
         source_info = SourceInfo(
             source_slug="nvidia_security_bulletin",
@@ -266,11 +371,7 @@ class NVIDIACollector:
             language="en",
         )
         
-        labels: list[str] = []
-        if bulletin_id:
-            labels.append(f"bulletin_id:{bulletin_id}")
-        if cve_ids:
-            labels.extend([f"cve:{cve_id}" for cve_id in cve_ids])
+        labels = ([f"bulletin_id:{bulletin_id}"] if bulletin_id else []) + ["cve:" + cve_id for cve_id in cve_ids]
         
         topics = ["official_bulletin"]
         if cve_ids:
@@ -287,7 +388,7 @@ class NVIDIACollector:
         }
         
         if time_meta:
-            extra["time_meta"] = time_meta
+            extra["time_meta"] = dict(time_meta)
 
         raw = dict(item)
 
@@ -304,12 +405,13 @@ class NVIDIACollector:
 
     def collect(self) -> List[BulletinCreate]:
         """Collect and normalize NVIDIA security bulletins."""
-        items = self.fetch_list()
-        
-        # Load previously seen bulletin IDs
+        # Load previously seen bulletin IDs (and the list validators) before fetching
         seen_ids = self.load_cursor()
         if seen_ids is None:
             seen_ids = set()
+        previous_validators = dict(self._list_validators)
+        
+        items = self.fetch_list()
         
         # Filter out already seen bulletins
         new_items = [item for item in items if item.get("bulletin id", "") not in seen_ids]
@@ -318,14 +420,17 @@ class NVIDIACollector:
         bulletins = []
         new_ids = set()
         
-        for item in new_items:
-            bulletin = self.normalize(item)
+        details = self._prefetch_details(new_items)
+        fetched_at = datetime.now(timezone.utc)
+        for item, detail in zip(new_items, details):
+            bulletin = self.normalize(item, detail, fetched_at=fetched_at)
             bulletins.append(bulletin)
             new_ids.add(bulletin.source.external_id)
         
-        # Add new IDs to seen set and save
-        all_seen_ids = seen_ids.union(new_ids)
-        self.save_cursor(all_seen_ids)
+        # Add new IDs to seen set and save; an unchanged cursor is not rewritten
+        if new_ids or self._list_validators != previous_validators:
+            seen_ids |= new_ids
+            self.save_cursor(seen_ids)
         
         return bulletins
 
@@ -345,8 +450,7 @@ def run(
         if token:
             headers["Authorization"] = f"Bearer {token}"
         session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        api_response = session.post(ingest_url, json=payload, timeout=30)
+        api_response = session.post(ingest_url, data=encode_bulletins(bulletins), timeout=30)
         api_response.raise_for_status()
         try:
             response_data = api_response.json()
@@ -8,7 +8,14 @@ from unittest.mock import Mock, patch
 import pytest
 import requests
 
-from resources.nvidia_security_bulletin.collector import NVIDIACollector, _extract_cve_ids, _clean_html_content
+from resources.nvidia_security_bulletin.collector import (
+    NVIDIACollector,
+    _clean_html_content,
+    _extract_cve_ids,
+    _extract_url_from_html_link,
+    _markdown_title,
+    _severity_level,
+)
 
 
 @pytest.fixture
@@ -34,6 +41,9 @@ def test_extract_cve_ids():
     expected = ["CVE-2025-1234", "CVE-2025-1235", "CVE-2025-1236"]
     assert _extract_cve_ids(input_str) == expected
     
+    # Full-width and whitespace separators, lowercase and malformed tokens
+    assert _extract_cve_ids("cve-2025-1234，CVE-2025-12345\nCVE-25-1 N/A") == ["CVE-2025-1234", "CVE-2025-12345"]
+    
     # Edge cases
     assert _extract_cve_ids(None) == []
     assert _extract_cve_ids("") == []
@@ -52,6 +62,17 @@ def test_clean_html_content():
     # Test with empty input
     assert _clean_html_content("") == ""
 
+    # Test markup with an XML encoding declaration, which lxml rejects as str
+    assert _clean_html_content('<?xml version="1.0" encoding="utf-8"?><p>x</p>') == "x"
+
+
+def test_extract_url_from_html_link():
+    """Test href extraction from the API title anchor."""
+    link = "<a href='https://nvidia.custhelp.com/app/answers/detail/a_id/5703?x=1&amp;y=2' target='_blank'>Title</a>"
+    assert _extract_url_from_html_link(link) == "https://nvidia.custhelp.com/app/answers/detail/a_id/5703?x=1&y=2"
+    assert _extract_url_from_html_link('<A HREF="https://example.com">x</A>') == "https://example.com"
+    assert _extract_url_from_html_link("plain title") is None
+
 
 def test_fetch_list():
     """Test fetching the list of security bulletins."""
@@ -97,6 +118,8 @@ def test_fetch_list():
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status.return_value = None
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_session_instance.get.return_value = mock_response
         mock_session_class.return_value = mock_session_instance
         
@@ -212,6 +235,8 @@ def test_collect_with_seen_ids(tmp_path):
         mock_response = Mock()
         mock_response.json.return_value = mock_response_data
         mock_response.raise_for_status.return_value = None
+        mock_response.status_code = 200
+        mock_response.headers = {}
         mock_session_instance.get.return_value = mock_response
         mock_session_class.return_value = mock_session_instance
         
@@ -228,5 +253,106 @@ def test_collect_with_seen_ids(tmp_path):
         assert "5704" in updated_ids
 
 
+def test_prefetch_details_aligns_with_items():
+    """Test concurrent detail fetches keep item order and fall back to custhelp."""
+    collector = NVIDIACollector(session=Mock())
+    items = [
+        {"bulletin id": "5703", "publish date": "09 Oct 2025", "title": "<a href='https://nvidia.custhelp.com/a/5703'>A</a>"},
+        {"bulletin id": "5704", "publish date": "30 Sep 2025", "title": "<a href='https://nvidia.custhelp.com/a/5704'>B</a>"},
+        {"bulletin id": "", "title": "C"},
+    ]
+    github = {"5703": ("GitHub 5703", "# GitHub 5703")}
+
+    with patch.object(collector, "fetch_github_detail", side_effect=lambda bid, year: github.get(bid)) as fetch_github, \
+            patch.object(collector, "fetch_custhelp_detail", side_effect=lambda url: ("Custhelp", url)):
+        details = collector._prefetch_details(items)
+
+    assert details == [
+        ("GitHub 5703", "# GitHub 5703"),
+        ("Custhelp", "https://nvidia.custhelp.com/a/5704"),
+        None,
+    ]
+    assert [call.args for call in fetch_github.call_args_list] == [("5703", 2025), ("5704", 2025)]
+
+
+def test_cursor_is_sorted_and_not_rewritten_without_new_ids(tmp_path):
+    """Test the cursor is stored sorted and left alone when nothing is new."""
+    state_file = tmp_path / ".nvidia_cursor"
+    collector = NVIDIACollector(session=Mock(), state_path=state_file)
+    collector.save_cursor({"5705", "5703"})
+    assert json.loads(state_file.read_text(encoding="utf-8")) == {"seen": ["5703", "5705"]}
+
+    with patch.object(collector, "fetch_list", return_value=[{"bulletin id": "5703"}]), \
+            patch.object(collector, "save_cursor") as save_cursor:
+        assert collector.collect() == []
+    save_cursor.assert_not_called()
+
+
+def test_fetch_github_detail_remembers_misses():
+    """Test a GitHub 404 is not requested again within the same run."""
+    session = Mock()
+    session.get.return_value = Mock(status_code=404)
+    collector = NVIDIACollector(session=session)
+
+    assert collector.fetch_github_detail("5703", 2025) is None
+    assert collector.fetch_github_detail("5703", 2025) is None
+    assert session.get.call_count == 1
+    assert "/2025/5703/5703.md" in session.get.call_args.args[0]
+
+
+def test_fetch_list_uses_conditional_get(tmp_path):
+    """Test the list request sends stored validators and a 304 ends the run early."""
+    state_file = tmp_path / ".nvidia_cursor"
+    state_file.write_text(json.dumps(["5703"]), encoding="utf-8")
+    session = Mock()
+    fresh = Mock(status_code=200, headers={"ETag": '"v1"'})
+    fresh.json.return_value = {"data": []}
+    session.get.return_value = fresh
+
+    collector = NVIDIACollector(session=session, state_path=state_file)
+    assert collector.collect() == []
+    assert json.loads(state_file.read_text(encoding="utf-8")) == {"seen": ["5703"], "etag": '"v1"'}
+
+    session.get.return_value = Mock(status_code=304)
+    collector = NVIDIACollector(session=session, state_path=state_file)
+    assert collector.collect() == []
+    assert session.get.call_args.kwargs["headers"] == {"If-None-Match": '"v1"'}
+
+
+def test_markdown_title():
+    """Test the first level-one heading is used as the GitHub bulletin title."""
+    assert _markdown_title("# Security Bulletin: GPU Driver\n\nBody") == "Security Bulletin: GPU Driver"
+    assert _markdown_title("intro\n## Sub\n# Real Title") == "Real Title"
+    assert _markdown_title("no heading here") is None
+
+
+def test_fetch_custhelp_detail_extracts_main_column():
+    """Test custhelp text comes from the main column with scripts removed."""
+    page = (
+        "<html><head><title> Security Bulletin 5703 </title></head><body>"
+        "<div id='rn_Header'>Navigation</div>"
+        "<div id='rn_MainColumn' role='main'><h1>Summary</h1><p>Update the <b>driver</b>.</p>"
+        "<script>track();</script></div></body></html>"
+    )
+    session = Mock()
+    session.get.return_value = Mock(text=page)
+    collector = NVIDIACollector(session=session)
+
+    assert collector.fetch_custhelp_detail("https://nvidia.custhelp.com/a/5703") == (
+        "Security Bulletin 5703",
+        "Summary Update the driver .",
+    )
+
+
+def test_severity_level_falls_back_to_substring_scan():
+    """Test combined severity labels still map to the highest listed level."""
+    assert _severity_level("High") == "high"
+    assert _severity_level("Moderate") == "medium"
+    assert _severity_level("High, Medium") == "high"
+    assert _severity_level("Medium/Low") == "medium"
+    assert _severity_level("N/A") is None
+    assert _severity_level("") is None
+
+
 if __name__ == "__main__":
-    pytest.main([__file__])
\ No newline at end of file
+    pytest.main([__file__])
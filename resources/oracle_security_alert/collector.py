@@ -1,31 +1,81 @@
 """Oracle Security Alert collector plugin."""
 from __future__ import annotations
 
+import bisect
+import json
 import logging
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass
-from datetime import datetime, timezone
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from html import unescape
 from pathlib import Path
-from typing import List, Sequence
+from typing import Iterable, Iterator, List, Sequence
 from urllib.parse import urlparse
 
 import requests
 from bs4 import BeautifulSoup
 
+try:  # Optional lxml backend for BeautifulSoup; html.parser is the fallback.
+    from lxml import etree
+except ImportError:  # pragma: no cover - optional dependency
+    etree = None  # type: ignore
+
+try:  # Optional C-backed HTML parser for article pages; BeautifulSoup is the fallback.
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    HTMLParser = None  # type: ignore
+
+from app.collector_utils import (
+    decoded_stream,
+    encode_bulletins,
+    ingest_headers,
+    iter_xml_items,
+    load_validators,
+    pooled_session,
+    save_validators,
+)
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
 LOGGER = logging.getLogger(__name__)
+SOURCE_SLUG = "oracle_security_alert"
+TOPICS = ("official_bulletin",)
+LABELS = ("vendor:oracle",)
 FEED_URL = "https://www.oracle.com/ocom/groups/public/@otn/documents/webcontent/rss-otn-sec.xml"
 STATE_FILE_NAME = ".cursor"
+ARTICLE_CACHE_FILE_NAME = ".article_cache.json"
+FEED_VALIDATORS_FILE_NAME = ".feed_validators.json"
+ARTICLE_CACHE_LIMIT = 128
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
     "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/124.0.0.0 Safari/537.36"
 )
 ARTICLE_ACCEPT = "text/html,application/xhtml+xml;q=0.9,*/*;q=0.8"
-
-
-@dataclass
+ARTICLE_FETCH_WORKERS = 8
+INGEST_BATCH_SIZE = 50
+HTML_PARSER = "lxml" if etree is not None else "html.parser"
+# Candidate article containers, most specific first.
+ROOT_SELECTORS = ("article", ".content", "#content", ".main-content")
+NOISE_TEXTS = frozenset({"skip to content", "skip to main content"})
+TRACKED_SECTIONS_SELECTOR = '[data-trackas="header"], [data-trackas="footer"]'
+_MIN_DT = datetime.min.replace(tzinfo=timezone.utc)
+_ZERO_OFFSET = timedelta(0)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+_DEFAULT_STATE_PATH = Path(__file__).resolve().with_name(STATE_FILE_NAME)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Return ``value`` in UTC (naive values are taken as UTC), skipping no-op conversions."""
+    if value.tzinfo is timezone.utc:
+        return value
+    if value.tzinfo is None or value.utcoffset() == _ZERO_OFFSET:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+
+@dataclass(slots=True)
 class FeedEntry:
     guid: str
     title: str
@@ -35,6 +85,14 @@ class FeedEntry:
     fetched_at: datetime
     time_meta: dict | None
     raw_pub_date: str | None
+    external_id: str = field(init=False)
+
+    def __post_init__(self) -> None:
+        # Resolve the guid/title fallbacks once so normalize() can stay branch-free.
+        self.link = self.link.strip()
+        self.guid = (self.guid or "").strip() or self.link
+        self.title = (self.title or "").strip() or self.link
+        self.external_id = self.guid
 
 
 class OracleSecurityCollector:
@@ -47,9 +105,13 @@ class OracleSecurityCollector:
         feed_url: str | None = None,
         state_path: Path | None = None,
     ) -> None:
-        self.session = session or requests.Session()
+        # Pooled for the concurrent article fetches; run() reuses it for ingest.
+        self.session = session or pooled_session()
         self.feed_url = feed_url or FEED_URL
-        self.state_path = state_path or Path(__file__).resolve().with_name(STATE_FILE_NAME)
+        self.state_path = state_path or _DEFAULT_STATE_PATH
+        self.article_cache_path = self.state_path.with_name(ARTICLE_CACHE_FILE_NAME)
+        self.feed_validators_path = self.state_path.with_name(FEED_VALIDATORS_FILE_NAME)
+        self._feed_validators: dict[str, str] = {}
         self.session.headers.update(
             {
                 "User-Agent": USER_AGENT,
@@ -71,62 +133,112 @@ class OracleSecurityCollector:
         except ValueError:
             LOGGER.warning("Invalid cursor value '%s'", raw)
             return None
-        if dt.tzinfo is None:
-            dt = dt.replace(tzinfo=timezone.utc)
-        return dt.astimezone(timezone.utc)
+        return _as_utc(dt)
 
     def save_cursor(self, value: datetime) -> None:
-        value = value.astimezone(timezone.utc)
-        self.state_path.write_text(value.isoformat(), encoding="utf-8")
+        if value.tzinfo is not timezone.utc:
+            value = value.astimezone(timezone.utc)
+        # Write then rename so a crash mid-write cannot leave an empty cursor behind.
+        tmp_path = self.state_path.with_name(self.state_path.name + ".tmp")
+        tmp_path.write_text(value.isoformat(), encoding="utf-8")
+        tmp_path.replace(self.state_path)
+
+    # Article cache helpers -------------------------------------------
+    def load_article_cache(self) -> dict[str, dict]:
+        """Load extracted article text and HTTP validators keyed by URL."""
+        try:
+            cache = json.loads(self.article_cache_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            LOGGER.warning("Invalid article cache %s", self.article_cache_path)
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def save_article_cache(self, cache: dict[str, dict]) -> None:
+        """Persist the most recently used article cache entries."""
+        entries = list(cache.items())[-ARTICLE_CACHE_LIMIT:]
+        try:
+            self.article_cache_path.write_text(json.dumps(dict(entries)), encoding="utf-8")
+        except OSError as exc:
+            LOGGER.warning("Failed to save article cache %s: %s", self.article_cache_path, exc)
+
+    # Feed validator helpers ------------------------------------------
+    def load_feed_validators(self) -> dict[str, str]:
+        """Load the feed's ETag / Last-Modified from the previous run."""
+        return load_validators(self.feed_validators_path)
+
+    def save_feed_validators(self) -> None:
+        """Persist the validators of the last successfully processed feed response."""
+        save_validators(self.feed_validators_path, self._feed_validators)
 
     # Fetch -----------------------------------------------------------
-    def fetch_feed(self) -> Sequence[FeedEntry]:
-        response = self.session.get(self.feed_url, timeout=30)
-        response.raise_for_status()
+    def fetch_feed(self, *, revalidate: bool = True) -> Iterator[FeedEntry]:
+        """Yield feed entries while the RSS body is still streaming in.
+
+        With ``revalidate`` the request carries the stored ETag /
+        Last-Modified and an unchanged feed (304 Not Modified) yields nothing.
+        """
+        headers: dict[str, str] = {}
+        if revalidate:
+            validators = self.load_feed_validators()
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        response = self.session.get(self.feed_url, timeout=30, headers=headers or None, stream=True)
         try:
-            root = ET.fromstring(response.text)
-        except ET.ParseError as exc:
-            raise ValueError("Failed to parse Oracle Security Alert RSS feed") from exc
-
-        items: list[FeedEntry] = []
-        for item in root.findall("./channel/item"):
-            link = (item.findtext("link") or "").strip()
-            title = (item.findtext("title") or link).strip()
-            description = item.findtext("description") or None
-            guid = (item.findtext("guid") or link or title).strip()
-            fetched_at = datetime.now(timezone.utc)
-            raw_pub_date = item.findtext("pubDate")
-            published_at, time_meta = resolve_published_at(
-                "oracle_security_alert",
-                [(raw_pub_date, "item.pubDate")],
-                fetched_at=fetched_at,
-            )
-            if not link:
-                continue
-            items.append(
-                FeedEntry(
-                    guid=guid or link,
-                    title=title or link,
-                    link=link,
-                    description=description.strip() if description else None,
-                    published_at=published_at,
-                    fetched_at=fetched_at,
-                    time_meta=time_meta if time_meta else None,
-                    raw_pub_date=raw_pub_date.strip() if isinstance(raw_pub_date, str) else None,
-                )
-            )
-        return items
+            if response.status_code == 304:
+                return
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            self._feed_validators = {
+                key: value for key, value in (("etag", etag), ("last_modified", last_modified)) if value
+            }
+            try:
+                for item in iter_xml_items(decoded_stream(response)):
+                    entry = self._build_entry(self._item_fields(item))
+                    if entry is not None:
+                        yield entry
+            except SyntaxError as exc:  # ElementTree.ParseError and lxml XMLSyntaxError
+                raise ValueError("Failed to parse Oracle Security Alert RSS feed") from exc
+        finally:
+            response.close()
+
+    @staticmethod
+    def _build_entry(fields: dict[str, str | None]) -> FeedEntry | None:
+        link = (fields.get("link") or "").strip()
+        if not link:
+            return None
+        description = fields.get("description") or None
+        fetched_at = datetime.now(timezone.utc)
+        raw_pub_date = fields.get("pubDate")
+        published_at, time_meta = resolve_published_at(
+            SOURCE_SLUG,
+            [(raw_pub_date, "item.pubDate")],
+            fetched_at=fetched_at,
+        )
+        return FeedEntry(
+            guid=fields.get("guid") or "",
+            title=fields.get("title") or "",
+            link=link,
+            description=description.strip() if description else None,
+            published_at=published_at,
+            fetched_at=fetched_at,
+            time_meta=time_meta if time_meta else None,
+            raw_pub_date=raw_pub_date.strip() if isinstance(raw_pub_date, str) else None,
+        )
 
     # Normalize -------------------------------------------------------
-    def normalize(self, entry: FeedEntry) -> BulletinCreate:
+    def normalize(self, entry: FeedEntry, article_text: str | None = None) -> BulletinCreate:
+        """Normalize a feed entry, using its prefetched article text when available."""
         origin_url = entry.link if self._is_valid_url(entry.link) else None
-        external_id = self._derive_external_id(entry, origin_url)
         source = SourceInfo(
-            source_slug="oracle_security_alert",
-            external_id=external_id,
+            source_slug=SOURCE_SLUG,
+            external_id=entry.external_id,
             origin_url=origin_url,
         )
-        article_text = self._fetch_article_body(origin_url)
         summary = None
         if article_text:
             summary = self._generate_summary(article_text, limit=500)
@@ -139,8 +251,6 @@ class OracleSecurityCollector:
             published_at=entry.published_at,
             language="en",
         )
-        topics = ["official_bulletin"]
-        labels = ["vendor:oracle"]
         extra = {
             "guid": entry.guid,
             "link": entry.link,
@@ -154,8 +264,8 @@ class OracleSecurityCollector:
             content=content,
             severity=None,
             fetched_at=entry.fetched_at,
-            labels=labels,
-            topics=topics,
+            labels=list(LABELS),
+            topics=list(TOPICS),
             extra=extra,
             raw={
                 "feed_entry": {
@@ -171,33 +281,38 @@ class OracleSecurityCollector:
     # Collect ---------------------------------------------------------
     def collect(self, *, limit: int | None = None, force: bool = False) -> List[BulletinCreate]:
         cursor = None if force else self.load_cursor()
-        entries = list(self.fetch_feed())
-        entries.sort(key=lambda item: item.published_at or datetime.min.replace(tzinfo=timezone.utc))
-
-        selected: list[FeedEntry] = []
-        for entry in entries:
-            if cursor and entry.published_at and entry.published_at <= cursor:
-                continue
-            selected.append(entry)
+        entries = list(self.fetch_feed(revalidate=not force))
+        entries.sort(key=lambda item: item.published_at or _MIN_DT)
+
+        selected = entries
+        if cursor:
+            # Undated entries sort first and are always kept; dated ones must be newer than the cursor.
+            keys = [entry.published_at or _MIN_DT for entry in entries]
+            undated = bisect.bisect_right(keys, _MIN_DT)
+            selected = entries[:undated] + entries[bisect.bisect_right(keys, cursor, lo=undated):]
         if limit is not None and limit > 0:
             selected = selected[-limit:]
 
+        # Later duplicates replace earlier ones but keep the first position.
         dedup: dict[str, BulletinCreate] = {}
-        order: list[str] = []
-        for entry in selected:
-            bulletin = self.normalize(entry)
-            external_id = bulletin.source.external_id or bulletin.source.origin_url or bulletin.content.title
-            if external_id in dedup:
-                dedup[external_id] = bulletin
-            else:
-                dedup[external_id] = bulletin
-                order.append(external_id)
-
-        bulletins = [dedup[key] for key in order]
+        for entry, article_text in zip(selected, self._prefetch_articles(selected, revalidate=not force)):
+            dedup[entry.external_id] = self.normalize(entry, article_text)
+
+        bulletins = list(dedup.values())
         if bulletins and selected[-1].published_at and not force:
             self.save_cursor(selected[-1].published_at)
+        if self._feed_validators:
+            self.save_feed_validators()
         return bulletins
 
+    @staticmethod
+    def _item_fields(item) -> dict[str, str | None]:
+        """Map child tag to text in one pass, keeping the first occurrence like ``findtext``."""
+        fields: dict[str, str | None] = {}
+        for child in item:
+            fields.setdefault(child.tag, child.text)
+        return fields
+
     @staticmethod
     def _is_valid_url(value: str | None) -> bool:
         if not value:
@@ -205,50 +320,68 @@ class OracleSecurityCollector:
         parsed = urlparse(value.strip())
         return bool(parsed.scheme and parsed.netloc)
 
-    def _derive_external_id(self, entry: FeedEntry, origin_url: str | None) -> str | None:
-        candidates: list[str] = []
-        if entry.guid:
-            candidates.append(entry.guid)
-        if origin_url:
-            parsed = urlparse(origin_url)
-            slug = Path(parsed.path).stem
-            if slug:
-                candidates.append(slug)
-        if entry.link:
-            candidates.append(entry.link)
-        if entry.title:
-            candidates.append(entry.title)
-        for candidate in candidates:
-            cleaned = candidate.strip()
-            if cleaned:
-                return cleaned
-        return None
-
-    def _fetch_article_body(self, url: str | None) -> str | None:
-        if not self._is_valid_url(url):
+    def _prefetch_articles(self, entries: Sequence[FeedEntry], *, revalidate: bool = True) -> list[str | None]:
+        """Fetch article text concurrently, returning results aligned with ``entries``.
+
+        Articles cached by a previous run are revalidated with their ETag /
+        Last-Modified and a 304 reuses the cached text without parsing. With
+        ``revalidate=False`` (``collect(force=True)``) every article is
+        downloaded again and the cache refreshed.
+        """
+        if not entries:
+            return []
+        cache = self.load_article_cache()
+        urls = [entry.link if self._is_valid_url(entry.link) else None for entry in entries]
+        validators = [cache.get(url) if revalidate and url else None for url in urls]
+        with ThreadPoolExecutor(max_workers=min(ARTICLE_FETCH_WORKERS, len(entries))) as executor:
+            responses = list(executor.map(self._fetch_article, urls, validators))
+
+        texts: list[str | None] = []
+        for url, cached, response in zip(urls, validators, responses):
+            if response is None:
+                texts.append(None)
+                continue
+            if response.status_code == 304 and cached:
+                cached_entry = cache.pop(url, cached)
+                cache[url] = cached_entry
+                texts.append(cached_entry.get("text"))
+                continue
+            text = self._extract_text(response.text)
+            texts.append(text)
+            headers = getattr(response, "headers", None) or {}
+            etag, last_modified = headers.get("ETag"), headers.get("Last-Modified")
+            cache.pop(url, None)
+            if text and (etag or last_modified):
+                cache[url] = {"etag": etag, "last_modified": last_modified, "text": text}
+        self.save_article_cache(cache)
+        return texts
+
+    def _fetch_article(self, url: str | None, cached: dict | None = None) -> requests.Response | None:
+        if url is None:
             return None
+        headers = {"Accept": ARTICLE_ACCEPT}
+        if cached and cached.get("etag"):
+            headers["If-None-Match"] = cached["etag"]
+        if cached and cached.get("last_modified"):
+            headers["If-Modified-Since"] = cached["last_modified"]
         try:
-            response = self.session.get(url, timeout=30, headers={"Accept": ARTICLE_ACCEPT})
-            response.raise_for_status()
+            response = self.session.get(url, timeout=30, headers=headers)
+            if response.status_code != 304:
+                response.raise_for_status()
         except requests.RequestException as exc:
             LOGGER.debug("Failed to fetch article %s: %s", url, exc)
             return None
-
-        return self._extract_text(response.text)
+        return response
 
     @staticmethod
     def _extract_text(html: str) -> str | None:
-        soup = BeautifulSoup(html, "html.parser")
-        OracleSecurityCollector._remove_tracked_sections(soup, marker="header")
-        OracleSecurityCollector._remove_tracked_sections(soup, marker="footer")
-        paragraphs = OracleSecurityCollector._collect_paragraphs(
-            soup.select_one("article")
-            or soup.select_one(".content")
-            or soup.select_one("#content")
-            or soup.select_one(".main-content")
-            or soup.body
-            or soup
-        )
+        if HTMLParser is not None:
+            return OracleSecurityCollector._extract_text_selectolax(html)
+        soup = BeautifulSoup(html, HTML_PARSER)
+        for element in soup.select(TRACKED_SECTIONS_SELECTOR):
+            element.decompose()
+        root = next(filter(None, map(soup.select_one, ROOT_SELECTORS)), None)
+        paragraphs = OracleSecurityCollector._collect_paragraphs(root or soup.body or soup)
         if not paragraphs:
             fallback = soup.get_text(separator="\n\n", strip=True)
             text = OracleSecurityCollector._strip_noise_lines(fallback)
@@ -256,14 +389,40 @@ class OracleSecurityCollector:
         text = "\n\n".join(paragraphs).strip()
         return text or None
 
+    @staticmethod
+    def _extract_text_selectolax(html: str) -> str | None:
+        tree = HTMLParser(html)
+        for node in tree.css(TRACKED_SECTIONS_SELECTOR):
+            node.decompose()
+        root = next(filter(None, map(tree.css_first, ROOT_SELECTORS)), None) or tree.body or tree.root
+        if root is None:
+            return None
+        paragraphs = OracleSecurityCollector._filter_paragraphs(
+            node.text(separator=" ", strip=True) for node in root.css("p, li")
+        )
+        if not paragraphs:
+            # Match BeautifulSoup's get_text, which skips script and style bodies.
+            for node in tree.css("script, style"):
+                node.decompose()
+            fallback = tree.root.text(separator="\n\n", strip=True) if tree.root else ""
+            text = OracleSecurityCollector._strip_noise_lines(fallback)
+            return text or None
+        text = "\n\n".join(paragraphs).strip()
+        return text or None
+
     @staticmethod
     def _collect_paragraphs(root) -> list[str]:
         if root is None:
             return []
+        return OracleSecurityCollector._filter_paragraphs(
+            " ".join(element.stripped_strings) for element in root.find_all(["p", "li"])
+        )
+
+    @staticmethod
+    def _filter_paragraphs(texts: Iterable[str]) -> list[str]:
         paragraphs: list[str] = []
         seen: set[str] = set()
-        for element in root.find_all(["p", "li"]):
-            text = " ".join(element.stripped_strings)
+        for text in texts:
             if not text:
                 continue
             if OracleSecurityCollector._is_noise_text(text):
@@ -278,14 +437,12 @@ class OracleSecurityCollector:
     def _clean_summary(value: str | None) -> str | None:
         if not value:
             return None
-        soup = BeautifulSoup(value, "html.parser")
-        text = soup.get_text(" ", strip=True)
+        text = _WS_RE.sub(" ", unescape(_TAG_RE.sub(" ", value))).strip()
         return text or None
 
     @staticmethod
     def _is_noise_text(value: str) -> bool:
-        normalized = value.strip().lower()
-        return normalized in {"skip to content", "skip to main content"}
+        return value.strip().lower() in NOISE_TEXTS
 
     @staticmethod
     def _strip_noise_lines(text: str) -> str:
@@ -313,11 +470,6 @@ class OracleSecurityCollector:
             return text[:limit]
         return f"{truncated}..."
 
-    @staticmethod
-    def _remove_tracked_sections(soup: BeautifulSoup, *, marker: str) -> None:
-        for element in soup.select(f'[data-trackas="{marker}"]'):
-            element.decompose()
-
 
 def run(
     ingest_url: str | None = None,
@@ -330,18 +482,21 @@ def run(
     bulletins = collector.collect(limit=limit, force=force)
     response_data = None
     if ingest_url and bulletins:
-        session = requests.Session()
-        headers = {"Content-Type": "application/json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        response = session.post(ingest_url, json=payload, timeout=30)
-        response.raise_for_status()
-        try:
-            response_data = response.json()
-        except ValueError:  # pragma: no cover
-            response_data = {"status_code": response.status_code}
+        headers = ingest_headers(token)
+        # Post in bounded batches and report the combined ingest counts.
+        response_data = {"accepted": 0, "duplicates": 0}
+        for start in range(0, len(bulletins), INGEST_BATCH_SIZE):
+            batch = bulletins[start : start + INGEST_BATCH_SIZE]
+            response = collector.session.post(
+                ingest_url, data=encode_bulletins(batch), headers=headers, timeout=30
+            )
+            response.raise_for_status()
+            try:
+                batch_data = response.json()
+            except ValueError:  # pragma: no cover
+                batch_data = {}
+            for key in response_data:
+                response_data[key] += int(batch_data.get(key) or 0)
     return bulletins, response_data
 
 
@@ -1,13 +1,17 @@
 """Tests for the Oracle Security Alert collector."""
 from __future__ import annotations
 
+import io
+import json
 from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
+from resources.oracle_security_alert import collector as collector_module
 from resources.oracle_security_alert.collector import (
     FEED_URL,
+    FeedEntry,
     OracleSecurityCollector,
 )
 
@@ -15,9 +19,10 @@ FIXTURE_DIR = Path(__file__).resolve().parent
 
 
 class MockResponse:
-    def __init__(self, *, text: str, status_code: int = 200):
+    def __init__(self, *, text: str, status_code: int = 200, headers: dict[str, str] | None = None):
         self._text = text
         self.status_code = status_code
+        self.headers = headers or {}
 
     def raise_for_status(self) -> None:
         if not (200 <= self.status_code < 300):
@@ -27,13 +32,30 @@ class MockResponse:
     def text(self) -> str:
         return self._text
 
+    @property
+    def content(self) -> bytes:
+        return self._text.encode("utf-8")
+
+    @property
+    def raw(self) -> io.BytesIO:
+        return io.BytesIO(self.content)
+
+    def close(self) -> None:
+        pass
+
 
 class FakeSession:
     def __init__(self, responses: dict[str, MockResponse]):
         self._responses = responses
         self.headers: dict[str, str] = {}
 
-    def get(self, url: str, timeout: int = 30, headers: dict[str, str] | None = None) -> MockResponse:
+    def get(
+        self,
+        url: str,
+        timeout: int = 30,
+        headers: dict[str, str] | None = None,
+        stream: bool = False,
+    ) -> MockResponse:
         try:
             return self._responses[url]
         except KeyError as exc:  # pragma: no cover - guard against unexpected URLs
@@ -127,3 +149,151 @@ def test_collect_deduplicates_by_external_id(tmp_path, feed_text, cpu_article_ht
     bulletins = collector.collect(force=True)
     external_ids = [bulletin.source.external_id for bulletin in bulletins]
     assert len(external_ids) == len(set(external_ids))
+
+
+def test_extract_text_matches_beautifulsoup_fallback(monkeypatch, cpu_article_html, alert_article_html):
+    fast = [OracleSecurityCollector._extract_text(html) for html in (cpu_article_html, alert_article_html)]
+    monkeypatch.setattr(collector_module, "HTMLParser", None)
+    fallback = [OracleSecurityCollector._extract_text(html) for html in (cpu_article_html, alert_article_html)]
+    assert fast == fallback
+    assert all(fast)
+
+
+class RecordingSession(FakeSession):
+    def __init__(self, responses: dict[str, MockResponse]):
+        super().__init__(responses)
+        self.request_headers: dict[str, dict[str, str]] = {}
+
+    def get(self, url: str, timeout: int = 30, headers: dict[str, str] | None = None, stream: bool = False):
+        self.request_headers[url] = dict(headers or {})
+        return super().get(url, timeout=timeout, headers=headers, stream=stream)
+
+
+def test_article_cache_reuses_text_on_not_modified(tmp_path, feed_text, cpu_article_html, alert_article_html):
+    cpu_url = "https://www.oracle.com/security-alerts/cpuoct2025.html"
+    alert_url = "https://www.oracle.com/security-alerts/alert-cve-2025-61882.html"
+    state_path = tmp_path / "cursor.txt"
+    first_session = FakeSession(
+        {
+            FEED_URL: MockResponse(text=feed_text),
+            cpu_url: MockResponse(text=cpu_article_html, headers={"ETag": '"cpu-v1"'}),
+            alert_url: MockResponse(text=alert_article_html),
+        }
+    )
+    first = OracleSecurityCollector(session=first_session, state_path=state_path).collect()
+    assert list(json.loads((tmp_path / ".article_cache.json").read_text())) == [cpu_url]
+
+    second_session = RecordingSession(
+        {
+            FEED_URL: MockResponse(text=feed_text),
+            cpu_url: MockResponse(text="", status_code=304),
+            alert_url: MockResponse(text=alert_article_html),
+        }
+    )
+    state_path.unlink()
+    second = OracleSecurityCollector(session=second_session, state_path=state_path).collect()
+
+    assert second_session.request_headers[cpu_url]["If-None-Match"] == '"cpu-v1"'
+    assert "If-None-Match" not in second_session.request_headers[alert_url]
+    assert [b.content.body_text for b in second] == [b.content.body_text for b in first]
+
+
+def test_feed_not_modified_skips_parsing(tmp_path, feed_text, cpu_article_html, alert_article_html):
+    cpu_url = "https://www.oracle.com/security-alerts/cpuoct2025.html"
+    alert_url = "https://www.oracle.com/security-alerts/alert-cve-2025-61882.html"
+    state_path = tmp_path / "cursor.txt"
+    first_session = FakeSession(
+        {
+            FEED_URL: MockResponse(text=feed_text, headers={"ETag": '"feed-v1"'}),
+            cpu_url: MockResponse(text=cpu_article_html),
+            alert_url: MockResponse(text=alert_article_html),
+        }
+    )
+    assert OracleSecurityCollector(session=first_session, state_path=state_path).collect()
+
+    second_session = RecordingSession({FEED_URL: MockResponse(text="", status_code=304)})
+    assert OracleSecurityCollector(session=second_session, state_path=state_path).collect() == []
+    assert second_session.request_headers[FEED_URL]["If-None-Match"] == '"feed-v1"'
+
+
+@pytest.mark.parametrize("payload", ["not xml at all", "<rss><channel><item><title>cut"])
+def test_malformed_feed_raises_and_keeps_cursor(tmp_path, payload):
+    state_path = tmp_path / "cursor.txt"
+    session = FakeSession({FEED_URL: MockResponse(text=payload, headers={"ETag": '"broken"'})})
+    collector = OracleSecurityCollector(session=session, state_path=state_path)
+
+    with pytest.raises(ValueError):
+        collector.collect()
+    assert not state_path.exists()
+    assert not collector.feed_validators_path.exists()
+
+
+def test_cursor_keeps_only_newer_entries(tmp_path, feed_text, cpu_article_html, alert_article_html):
+    state_path = tmp_path / "cursor.txt"
+    responses = {
+        FEED_URL: MockResponse(text=feed_text),
+        "https://www.oracle.com/security-alerts/cpuoct2025.html": MockResponse(text=cpu_article_html),
+        "https://www.oracle.com/security-alerts/alert-cve-2025-61882.html": MockResponse(text=alert_article_html),
+    }
+    collector = OracleSecurityCollector(session=FakeSession(responses), state_path=state_path)
+    collector.save_cursor(datetime(2025, 10, 14, 17, 59, tzinfo=timezone.utc))
+
+    bulletins = collector.collect()
+
+    assert [bulletin.source.external_id for bulletin in bulletins] == ["cpuoct2025"]
+
+
+def test_run_posts_bulletins_in_batches(monkeypatch, tmp_path, feed_text, cpu_article_html, alert_article_html):
+    responses = {
+        FEED_URL: MockResponse(text=feed_text),
+        "https://www.oracle.com/security-alerts/cpuoct2025.html": MockResponse(text=cpu_article_html),
+        "https://www.oracle.com/security-alerts/alert-cve-2025-61882.html": MockResponse(text=alert_article_html),
+    }
+    posts: list[tuple[list, dict]] = []
+
+    class IngestSession(FakeSession):
+        def post(self, url, data, headers, timeout):
+            posts.append((json.loads(data), headers))
+            return MockResponse(text="{}")
+
+    session = IngestSession(responses)
+    monkeypatch.setattr(collector_module, "INGEST_BATCH_SIZE", 1)
+    init = OracleSecurityCollector.__init__
+    monkeypatch.setattr(
+        OracleSecurityCollector,
+        "__init__",
+        lambda self: init(self, session=session, state_path=tmp_path / "cursor.txt"),
+    )
+    replies = iter([{"accepted": 1, "duplicates": 0}, {"accepted": 0, "duplicates": 1}])
+    monkeypatch.setattr(MockResponse, "json", lambda self: next(replies), raising=False)
+
+    bulletins, response_data = collector_module.run("http://ingest.local/api", token="secret")
+
+    assert [len(payload) for payload, _ in posts] == [1, 1]
+    assert [payload[0]["source"]["external_id"] for payload, _ in posts] == [
+        bulletin.source.external_id for bulletin in bulletins
+    ]
+    assert posts[0][1]["Authorization"] == "Bearer secret"
+    assert "Authorization" not in session.headers
+    assert response_data == {"accepted": 1, "duplicates": 1}
+
+
+def test_clean_summary_strips_tags_and_entities():
+    assert OracleSecurityCollector._clean_summary("<p>Fixes for <b>Oracle</b> &amp; MySQL</p>\n<br/>") == "Fixes for Oracle & MySQL"
+    assert OracleSecurityCollector._clean_summary("<p> </p>") is None
+    assert OracleSecurityCollector._clean_summary(None) is None
+
+
+def test_feed_entry_resolves_fallbacks_once():
+    entry = FeedEntry(
+        guid="  ",
+        title="",
+        link=" https://www.oracle.com/security-alerts/cpuoct2025.html ",
+        description=None,
+        published_at=None,
+        fetched_at=datetime(2025, 10, 21, tzinfo=timezone.utc),
+        time_meta=None,
+        raw_pub_date=None,
+    )
+    assert entry.link == "https://www.oracle.com/security-alerts/cpuoct2025.html"
+    assert entry.guid == entry.title == entry.external_id == entry.link
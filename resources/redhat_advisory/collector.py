@@ -1,15 +1,24 @@
 """Red Hat security advisory collector."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Iterable, Sequence
+import json
 import logging
 
 import requests
 from bs4 import BeautifulSoup
 
+try:  # Optional C-based HTML parser; BeautifulSoup's html.parser is the fallback.
+    from lxml import etree, html as lxml_html
+except ImportError:  # pragma: no cover - optional dependency
+    etree = lxml_html = None  # type: ignore
+HTML_PARSER = "lxml" if lxml_html is not None else "html.parser"
+
+from app.collector_utils import encode_bulletins, ingest_headers, pooled_session
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
@@ -45,6 +54,78 @@ BASE_QUERY_PARAMS = {
 
 ARTICLE_SELECTOR = "main#cp-main.portal-content-area"
 ARTICLE_ACCEPT = "text/html,application/xhtml+xml"
+ARTICLE_FETCH_WORKERS = 8
+SKIP_TEXTS = frozenset({"skip to content", "skip to main content"})
+_SKIP_TEXT_MAX_LEN = max(map(len, SKIP_TEXTS))
+BODY_CACHE_FILE_NAME = ".body_cache.json"
+BODY_CACHE_LIMIT = 256
+
+if etree is not None:
+    # Compiled once; mirror ARTICLE_SELECTOR, then the <main> / <body> fallbacks.
+    _CONTAINER_XPATHS = (
+        etree.XPath(
+            "//main[@id='cp-main'][contains(concat(' ', normalize-space(@class), ' '), ' portal-content-area ')]"
+        ),
+        etree.XPath("//main"),
+        etree.XPath("//body"),
+    )
+    _BLOCK_XPATH = etree.XPath(".//p | .//li")
+    _TEXT_XPATH = etree.XPath(".//text()")
+
+
+def _is_skip_text(text: str) -> bool:
+    # Only short strings can be skip links, so paragraphs are never lowercased.
+    return len(text) <= _SKIP_TEXT_MAX_LEN and text.lower() in SKIP_TEXTS
+
+
+def _join_text(element, separator: str) -> str:
+    return separator.join(part for part in (text.strip() for text in _TEXT_XPATH(element)) if part)
+
+
+def _extract_article_text_lxml(content: bytes) -> str | None:
+    """Extract advisory paragraphs with compiled XPath queries evaluated by libxml2."""
+    try:
+        tree = lxml_html.fromstring(content)
+    except (etree.ParserError, ValueError):
+        return None
+    # Script and style payloads would otherwise leak into the ``text()`` fallbacks.
+    etree.strip_elements(tree, "script", "style", "noscript", with_tail=False)
+    container = next((found[0] for xpath in _CONTAINER_XPATHS if (found := xpath(tree))), None)
+    if container is None:
+        return None
+    texts = (_join_text(element, " ") for element in _BLOCK_XPATH(container))
+    # dict.fromkeys keeps the first occurrence of every paragraph, in order.
+    text_parts = list(
+        dict.fromkeys(
+            text for text in texts if text and not _is_skip_text(text)
+        )
+    )
+    if text_parts:
+        return "\n\n".join(text_parts)
+    return _join_text(container, "\n") or None
+
+
+def _extract_article_text_soup(content: bytes) -> str | None:
+    soup = BeautifulSoup(content, HTML_PARSER)
+    container = soup.select_one(ARTICLE_SELECTOR) or soup.select_one("main") or soup.body
+    if not container:
+        return None
+    text_parts: list[str] = []
+    seen: set[str] = set()
+    for element in container.find_all(["p", "li"]):
+        text = " ".join(element.stripped_strings)
+        if not text:
+            continue
+        if _is_skip_text(text):
+            continue
+        if text in seen:
+            continue
+        seen.add(text)
+        text_parts.append(text)
+    if text_parts:
+        return "\n\n".join(text_parts)
+    fallback = container.get_text("\n", strip=True)
+    return fallback or None
 
 
 @dataclass
@@ -53,13 +134,23 @@ class FetchParams:
 
     start: int = 0
     rows: int = DEFAULT_ROWS
+    # When False, article pages are only fetched for advisories missing a synopsis or title.
+    fetch_body: bool = True
 
 
 class RedHatAdvisoryCollector:
     """Collector that fetches and normalizes Red Hat security advisories."""
 
-    def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        *,
+        body_cache_path: Path | None = None,
+    ) -> None:
+        # Pooled for the concurrent detail fetches; run() reuses it for ingest.
+        self.session = session or pooled_session()
+        self.body_cache_path = body_cache_path
+        self._body_cache = self.load_body_cache()
         self.session.headers.update(
             {
                 "Accept": "application/json",
@@ -71,6 +162,29 @@ class RedHatAdvisoryCollector:
             }
         )
 
+    def load_body_cache(self) -> dict[str, dict]:
+        """Load cached advisory bodies and their HTTP validators, if enabled."""
+        if self.body_cache_path is None:
+            return {}
+        try:
+            cache = json.loads(self.body_cache_path.read_bytes())
+        except FileNotFoundError:
+            return {}
+        except ValueError:
+            LOGGER.warning("Invalid advisory body cache %s", self.body_cache_path)
+            return {}
+        return cache if isinstance(cache, dict) else {}
+
+    def save_body_cache(self) -> None:
+        """Persist the most recently used advisory bodies, if enabled."""
+        if self.body_cache_path is None:
+            return
+        entries = list(self._body_cache.items())[-BODY_CACHE_LIMIT:]
+        try:
+            self.body_cache_path.write_text(json.dumps(dict(entries)), encoding="utf-8")
+        except OSError as exc:
+            LOGGER.warning("Failed to save advisory body cache %s: %s", self.body_cache_path, exc)
+
     def fetch(self, params: FetchParams) -> Sequence[dict]:
         payload = dict(BASE_QUERY_PARAMS)
         payload["start"] = str(params.start)
@@ -87,34 +201,58 @@ class RedHatAdvisoryCollector:
     def _fetch_article_body(self, url: str | None) -> str | None:
         if not url:
             return None
+        # Published advisories rarely change: revalidate the cached copy instead of re-parsing it.
+        cached = self._body_cache.pop(url, None)
+        headers = {"Accept": ARTICLE_ACCEPT}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
         try:
-            resp = self.session.get(url, timeout=30, headers={"Accept": ARTICLE_ACCEPT})
+            resp = self.session.get(url, timeout=30, headers=headers)
+            if cached and resp.status_code == 304:
+                self._body_cache[url] = cached
+                return cached.get("text")
             resp.raise_for_status()
         except requests.RequestException as exc:
             LOGGER.debug("Failed to fetch Red Hat advisory body %s: %s", url, exc)
+            if cached:
+                self._body_cache[url] = cached
+                return cached.get("text")
             return None
-        soup = BeautifulSoup(resp.text, "html.parser")
-        container = soup.select_one(ARTICLE_SELECTOR) or soup.select_one("main") or soup.body
-        if not container:
-            return None
-        text_parts: list[str] = []
-        seen: set[str] = set()
-        for element in container.find_all(["p", "li"]):
-            text = " ".join(element.stripped_strings)
-            if not text:
-                continue
-            if text.lower() in {"skip to content", "skip to main content"}:
-                continue
-            if text in seen:
-                continue
-            seen.add(text)
-            text_parts.append(text)
-        if text_parts:
-            return "\n\n".join(text_parts)
-        fallback = container.get_text("\n", strip=True)
-        return fallback or None
-
-    def normalize(self, item: dict) -> BulletinCreate:
+        # Hand over the raw bytes so the parser honours the page's declared charset.
+        text = _extract_article_text_lxml(resp.content) if lxml_html is not None else None
+        if text is None:
+            text = _extract_article_text_soup(resp.content)
+        etag = resp.headers.get("ETag")
+        last_modified = resp.headers.get("Last-Modified")
+        if text and (etag or last_modified):
+            self._body_cache[url] = {"etag": etag, "last_modified": last_modified, "text": text}
+        return text
+
+    def _prefetch_article_bodies(self, docs: Sequence[dict], *, fetch_body: bool = True) -> list[str | None]:
+        """Fetch advisory bodies concurrently, returning results aligned with ``docs``.
+
+        With ``fetch_body=False`` only advisories whose synopsis or title is
+        missing (and so need the body for their summary) are fetched.
+        """
+        if not docs:
+            return []
+        urls = [
+            doc.get("view_uri") if fetch_body or not (doc.get("portal_synopsis") and doc.get("allTitle")) else None
+            for doc in docs
+        ]
+        # Each distinct URL is fetched once, even if the API repeats an advisory.
+        unique_urls = list(dict.fromkeys(url for url in urls if url))
+        if not unique_urls:
+            return [None] * len(docs)
+        with ThreadPoolExecutor(max_workers=min(ARTICLE_FETCH_WORKERS, len(unique_urls))) as executor:
+            bodies = dict(zip(unique_urls, executor.map(self._fetch_article_body, unique_urls)))
+        return [bodies.get(url) if url else None for url in urls]
+
+    def normalize(self, item: dict, body_text: str | None = None) -> BulletinCreate:
+        """Normalize an advisory, using its prefetched article body when available."""
         external_id = str(item.get("id")) if item.get("id") else None
         origin_url = item.get("view_uri")
         fetched_at = datetime.now(timezone.utc)
@@ -125,7 +263,6 @@ class RedHatAdvisoryCollector:
         )
         severity = item.get("portal_severity")
         summary = item.get("portal_synopsis") or item.get("allTitle")
-        body_text = self._fetch_article_body(origin_url)
         if not summary and body_text:
             summary = body_text.splitlines()[0][:240]
 
@@ -171,11 +308,12 @@ class RedHatAdvisoryCollector:
         params = params or FetchParams()
         docs = self.fetch(params)
         bulletins: list[BulletinCreate] = []
-        for doc in docs:
+        for doc, body_text in zip(docs, self._prefetch_article_bodies(docs, fetch_body=params.fetch_body)):
             try:
-                bulletins.append(self.normalize(doc))
+                bulletins.append(self.normalize(doc, body_text))
             except Exception as exc:  # pragma: no cover - defensive
                 LOGGER.exception("Failed to normalize Red Hat advisory %s", doc, exc_info=exc)
+        self.save_body_cache()
         return bulletins
 
 
@@ -184,17 +322,16 @@ def run(
     token: str | None = None,
     params: FetchParams | None = None,
 ) -> tuple[list[BulletinCreate], dict | None]:
-    collector = RedHatAdvisoryCollector()
+    collector = RedHatAdvisoryCollector(
+        body_cache_path=Path(__file__).resolve().with_name(BODY_CACHE_FILE_NAME),
+    )
     bulletins = collector.collect(params=params)
     response_data = None
     if ingest_url and bulletins:
-        session = requests.Session()
-        headers = {"Content-Type": "application/json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        api_response = session.post(ingest_url, json=payload, timeout=30)
+        headers = ingest_headers(token)
+        api_response = collector.session.post(
+            ingest_url, data=encode_bulletins(bulletins), headers=headers, timeout=30
+        )
         api_response.raise_for_status()
         response_data = api_response.json()
     return bulletins, response_data
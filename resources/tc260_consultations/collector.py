@@ -1,15 +1,26 @@
 """TC260 standard consultation collector."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from html import unescape
 from datetime import datetime, timezone
 from typing import List, Sequence
 from urllib.parse import urljoin
+import math
 import re
 
 import requests
 from bs4 import BeautifulSoup
 
+try:  # Optional C-based HTML parser backend for BeautifulSoup.
+    import lxml  # noqa: F401
+except ImportError:  # pragma: no cover - optional dependency
+    HTML_PARSER = "html.parser"
+else:
+    HTML_PARSER = "lxml"
+
+from app.collector_utils import encode_bulletins, ingest_headers, pooled_session
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
@@ -22,6 +33,13 @@ REQUEST_HEADERS = {
 }
 DEFAULT_TOPIC = "policy-compliance"
 PAGE_SIZE = 10
+DETAIL_FETCH_WORKERS = 8
+DATE_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+# The list page is a flat run of <li class="... list_title_news"> blocks; scan them without a DOM.
+LIST_ITEM_RE = re.compile(rb'<li\b[^>]*class="[^"]*\blist_title_news\b[^"]*"[^>]*>(.*?)</li>', re.DOTALL | re.I)
+ANCHOR_RE = re.compile(rb'<a\b[^>]*?\bhref="([^"]*)"[^>]*>(.*?)</a>', re.DOTALL | re.I)
+LIST_TIME_RE = re.compile(rb'class="[^"]*\blist_time\b[^"]*"[^>]*>(.*?)</', re.DOTALL | re.I)
+TAG_RE = re.compile(rb"<[^>]+>")
 
 
 @dataclass
@@ -37,24 +55,72 @@ def _clean_text(value: str | None) -> str | None:
     return text or None
 
 
+def _fragment_text(fragment: bytes) -> str:
+    """Text of an HTML fragment, stripped per text node like ``get_text(strip=True)``."""
+    return "".join(unescape(part.decode("utf-8", errors="replace")).strip() for part in TAG_RE.split(fragment))
+
+
+def _parse_list_items(content: bytes) -> list[dict] | None:
+    """Extract list entries with regexes; ``None`` when the page has no recognisable items."""
+    blocks = LIST_ITEM_RE.findall(content)
+    if not blocks:
+        return None
+    items: list[dict] = []
+    for block in blocks:
+        anchor = ANCHOR_RE.search(block)
+        if anchor is None or not anchor.group(1):
+            continue
+        href = unescape(anchor.group(1).decode("utf-8", errors="replace"))
+        deadline_match = LIST_TIME_RE.search(block, anchor.end())
+        items.append(
+            {
+                "title": _fragment_text(anchor.group(2)),
+                "detail_url": urljoin(DETAIL_BASE_URL, href),
+                "deadline": _clean_text(_fragment_text(deadline_match.group(1)) if deadline_match else None),
+            }
+        )
+    return items
+
+
 class TC260ConsultationCollector:
     """Collector that scrapes TC260 consultation announcements."""
 
     def __init__(self, session: requests.Session | None = None) -> None:
-        self.session = session or requests.Session()
+        # Pooled for the concurrent detail fetches; run() reuses it for ingest.
+        self.session = session or pooled_session()
         self.session.headers.update(REQUEST_HEADERS)
 
     def fetch(self, params: FetchParams) -> Sequence[dict]:
-        collected: list[dict] = []
-        start = 0
         limit = params.limit
+        # With a limit the number of list pages is known up front, so request them together.
+        page_count = max(1, math.ceil(limit / PAGE_SIZE)) if limit else 1
+        starts = [index * PAGE_SIZE for index in range(page_count)]
+        if page_count == 1:
+            pages = [self._fetch_list_page(params.list_url, 0)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, page_count)) as executor:
+                pages = list(executor.map(lambda start: self._fetch_list_page(params.list_url, start), starts))
 
-        page_url = f"{params.list_url}?start={start}&length={PAGE_SIZE}"
+        collected: list[dict] = []
+        for page in pages:
+            if not page:
+                break
+            collected.extend(page)
+        if limit:
+            collected = collected[:limit]
+        return collected
+
+    def _fetch_list_page(self, list_url: str, start: int) -> list[dict]:
+        page_url = f"{list_url}?start={start}&length={PAGE_SIZE}"
         response = self.session.get(page_url, timeout=30)
         response.raise_for_status()
-        soup = BeautifulSoup(response.text, "html.parser")
-        items = soup.select("li.list-group-item.list_title_news")
-        for li in items:
+        items = _parse_list_items(response.content)
+        if items is not None:
+            return items
+        # Unrecognised markup: fall back to a full parse with CSS selectors.
+        soup = BeautifulSoup(response.content, HTML_PARSER)
+        items = []
+        for li in soup.select("li.list-group-item.list_title_news"):
             anchor = li.find("a")
             if anchor is None or not anchor.get("href"):
                 continue
@@ -63,27 +129,38 @@ class TC260ConsultationCollector:
             deadline_node = li.find(class_="list_time")
             deadline = _clean_text(deadline_node.get_text(strip=True) if deadline_node else None)
 
-            collected.append(
+            items.append(
                 {
                     "title": title,
                     "detail_url": detail_url,
                     "deadline": deadline,
                 }
             )
-            if limit and len(collected) >= limit:
-                break
-        if limit:
-            collected = collected[:limit]
-        return collected
+        return items
 
     def _fetch_detail(self, url: str) -> BeautifulSoup | None:
         response = self.session.get(url, timeout=30)
         response.raise_for_status()
-        return BeautifulSoup(response.text, "html.parser")
+        return BeautifulSoup(response.content, HTML_PARSER)
+
+    def _prefetch_details(self, items: Sequence[dict]) -> list[BeautifulSoup | None]:
+        """Fetch detail pages concurrently; failed requests come back as ``None``."""
+
+        def fetch(item: dict) -> BeautifulSoup | None:
+            try:
+                return self._fetch_detail(item["detail_url"])
+            except requests.RequestException:
+                return None
+
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(items))) as executor:
+            return list(executor.map(fetch, items))
 
-    def normalize(self, item: dict) -> BulletinCreate | None:
+    def normalize(self, item: dict, detail_soup: BeautifulSoup | None = None) -> BulletinCreate | None:
         fetched_at = datetime.now(timezone.utc)
-        detail_soup = self._fetch_detail(item["detail_url"])
+        if detail_soup is None:
+            detail_soup = self._fetch_detail(item["detail_url"])
         if detail_soup is None:
             return None
 
@@ -91,18 +168,20 @@ class TC260ConsultationCollector:
         if content_node is None:
             return None
 
-        lines = [segment.strip() for segment in content_node.get_text("\n", strip=True).split("\n") if segment.strip()]
+        # One pass over the text nodes collects the lines and the first date in them.
+        lines: list[str] = []
+        published_raw = None
+        for text in content_node.stripped_strings:
+            for segment in text.split("\n"):
+                segment = segment.strip()
+                if not segment:
+                    continue
+                if published_raw is None and (match := DATE_RE.search(segment)):
+                    published_raw = match.group(0)
+                lines.append(segment)
         if not lines:
             return None
 
-        # Determine published date.
-        published_raw = None
-        for line in lines:
-            match = re.search(r"\d{4}-\d{2}-\d{2}", line)
-            if match:
-                published_raw = match.group(0)
-                break
-
         published_at, time_meta = resolve_published_at(
             "tc260_consultations",
             [(published_raw, "detail.date")],
@@ -152,11 +231,10 @@ class TC260ConsultationCollector:
         params = params or FetchParams()
         items = self.fetch(params)
         bulletins: list[BulletinCreate] = []
-        for item in items:
-            try:
-                bulletin = self.normalize(item)
-            except requests.RequestException:
+        for item, detail_soup in zip(items, self._prefetch_details(items)):
+            if detail_soup is None:
                 continue
+            bulletin = self.normalize(item, detail_soup)
             if bulletin:
                 bulletins.append(bulletin)
         return bulletins
@@ -171,13 +249,8 @@ def run(
     bulletins = collector.collect(params=params)
     response_data = None
     if ingest_url and bulletins:
-        session = requests.Session()
-        headers = {"Content-Type": "application/json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        session.headers.update(headers)
-        payload = [bulletin.model_dump(mode="json") for bulletin in bulletins]
-        resp = session.post(ingest_url, json=payload, timeout=30)
+        headers = ingest_headers(token)
+        resp = collector.session.post(ingest_url, data=encode_bulletins(bulletins), headers=headers, timeout=30)
         resp.raise_for_status()
         response_data = resp.json()
     return bulletins, response_data
@@ -3,6 +3,7 @@ from pathlib import Path
 
 import pytest
 
+from resources.tc260_consultations import collector as collector_module
 from resources.tc260_consultations.collector import (
     FetchParams,
     TC260ConsultationCollector,
@@ -16,6 +17,7 @@ DETAIL_URL = "https://www.tc260.org.cn/front/bzzqyjDetail.html?id=20250827154251
 class MockResponse:
     def __init__(self, text: str, status_code: int = 200) -> None:
         self.text = text
+        self.content = text.encode("utf-8")
         self.status_code = status_code
 
     def raise_for_status(self) -> None:
@@ -58,3 +60,36 @@ def test_collect_tc260_consultations(fake_session: FakeSession) -> None:
     assert bulletin.content.published_at.tzinfo == timezone.utc
     assert bulletin.extra.get("deadline") == "[截至日期:2025-10-26]"
     assert "AAA 标准" in (bulletin.content.body_text or "")
+
+
+def test_fetch_requests_pages_needed_for_limit() -> None:
+    list_html = (SAMPLES / "list.html").read_text(encoding="utf-8")
+    session = FakeSession(
+        {
+            f"{LIST_URL}?start=0&length=10": MockResponse(list_html),
+            f"{LIST_URL}?start=10&length=10": MockResponse(list_html),
+            f"{LIST_URL}?start=20&length=10": MockResponse("<html><body><ul></ul></body></html>"),
+        }
+    )
+    collector = TC260ConsultationCollector(session=session)
+
+    items = collector.fetch(FetchParams(list_url=LIST_URL, limit=25))
+
+    assert len(items) == 4
+    assert items[:2] == items[2:]
+
+
+def test_list_regex_matches_soup_fallback(monkeypatch) -> None:
+    list_html = (
+        '<ul><li class="list-group-item list_title_news"><a href="/a?x=1&amp;y=2"> A &amp; <b>B</b> </a>'
+        '<span class="list_time">[截至日期:2025-10-26]</span></li>'
+        '<li class="list-group-item list_title_news"><a href="/b">B</a></li></ul>'
+    )
+    session = FakeSession({f"{LIST_URL}?start=0&length=10": MockResponse(list_html)})
+    collector = TC260ConsultationCollector(session=session)
+
+    fast = collector.fetch(FetchParams(list_url=LIST_URL))
+    monkeypatch.setattr(collector_module, "_parse_list_items", lambda content: None)
+    assert fast == collector.fetch(FetchParams(list_url=LIST_URL))
+    assert fast[0]["detail_url"] == "https://www.tc260.org.cn/a?x=1&y=2"
+    assert fast[1]["deadline"] is None
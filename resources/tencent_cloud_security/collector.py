@@ -1,18 +1,32 @@
 """Tencent Cloud security announcement collector plugin."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from functools import cached_property
 from datetime import datetime, timedelta, timezone
 from html import unescape
 from html.parser import HTMLParser
 from pathlib import Path
 from typing import Iterable, List, Sequence
+import heapq
 import json
 import logging
 import re
 
 import requests
 
+try:  # Optional fast JSON codec for the async page payload.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+try:  # Optional C-backed HTML parser; the stdlib HTMLParser stripper is the fallback.
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # pragma: no cover - optional dependency
+    LexborHTMLParser = None  # type: ignore
+
+from app.collector_utils import encode_bulletins, ingest_headers, pooled_session
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
@@ -21,11 +35,16 @@ USER_AGENT = "SecLensTencentCloudCollector/1.0"
 DEFAULT_LIST_URL = "https://cloud.tencent.com/announce/?categorys=21"
 DETAIL_URL_TEMPLATE = "https://cloud.tencent.com/announce/detail/{announce_id}"
 DEFAULT_LIMIT = 20
+DETAIL_FETCH_WORKERS = 8
+DETAIL_CHUNK_SIZE = 64 * 1024
 STATE_FILE_NAME = ".cursor"
 CHINA_TZ = timezone(timedelta(hours=8))
 
 
-ASYNC_DATA_PATTERN = re.compile(r"window\['__ASYNC_DATA__'\]\s*=\s*(\[[\s\S]*\])", re.MULTILINE)
+ASYNC_DATA_MARKER = b"window['__ASYNC_DATA__']"
+# Non-greedy and anchored on the closing </script>, so the match ends with the payload.
+ASYNC_DATA_PATTERN = re.compile(rb"window\['__ASYNC_DATA__'\]\s*=\s*(\[.*?\])\s*;?\s*</script>", re.DOTALL)
+SCRIPT_END = b"</script>"
 
 
 @dataclass
@@ -38,6 +57,10 @@ class AnnouncementSummary:
     is_important: bool
     announce_type: str | None
 
+    @cached_property
+    def origin_url(self) -> str:
+        return DETAIL_URL_TEMPLATE.format(announce_id=self.announce_id)
+
 
 @dataclass
 class AnnouncementDetail:
@@ -70,8 +93,19 @@ def _parse_datetime(value: str | None) -> datetime | None:
     if not value:
         return None
     try:
-        dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S")
-        dt = dt.replace(tzinfo=CHINA_TZ)
+        if len(value) == 19 and value[4] == value[7] == "-" and value[10] == " " and value[13] == value[16] == ":":
+            # Fixed "YYYY-MM-DD HH:MM:SS" layout: slice the fields instead of going through strptime.
+            dt = datetime(
+                int(value[0:4]),
+                int(value[5:7]),
+                int(value[8:10]),
+                int(value[11:13]),
+                int(value[14:16]),
+                int(value[17:19]),
+                tzinfo=CHINA_TZ,
+            )
+        else:
+            dt = datetime.strptime(value, "%Y-%m-%d %H:%M:%S").replace(tzinfo=CHINA_TZ)
         return dt.astimezone(timezone.utc)
     except ValueError:
         LOGGER.warning("Failed to parse datetime '%s'", value)
@@ -82,36 +116,43 @@ def _html_to_text(html_content: str | None) -> str | None:
     if not html_content:
         return None
     stripped = unescape(html_content)
+    if LexborHTMLParser is not None:
+        return _clean_text(LexborHTMLParser(stripped).text(separator=" "))
     parser = _HTMLStripper()
     parser.feed(stripped)
     return _clean_text(parser.get_text())
 
 
-def _extract_async_payload(html: str) -> list:
-    match = ASYNC_DATA_PATTERN.search(html)
-    if match:
-        payload_raw = match.group(1)
-    else:
-        marker = "window['__ASYNC_DATA__']"
-        idx = html.find(marker)
-        if idx == -1:
-            raise ValueError("Async payload not found in response")
-        eq_idx = html.find('=', idx)
-        if eq_idx == -1:
-            raise ValueError("Async payload not found in response")
-        snippet = html[eq_idx + 1:]
-        end_idx = snippet.find('</script>')
-        if end_idx != -1:
-            snippet = snippet[:end_idx]
-        payload_raw = snippet.strip()
-    if payload_raw.endswith(';'):
-        payload_raw = payload_raw[:-1].strip()
+def _extract_async_payload(html: bytes) -> list:
+    # bytes.find is a plain memchr-style scan; the regex only starts at the marker.
+    marker_at = html.find(ASYNC_DATA_MARKER)
+    match = ASYNC_DATA_PATTERN.search(html, marker_at) if marker_at != -1 else None
+    if match is None:
+        raise ValueError("Async payload not found in response")
     try:
-        return json.loads(payload_raw)
-    except json.JSONDecodeError as exc:
+        return orjson.loads(match.group(1)) if orjson is not None else json.loads(match.group(1))
+    except (json.JSONDecodeError, UnicodeDecodeError) as exc:
         raise ValueError("Failed to decode async payload") from exc
 
 
+def _read_until_async_payload(response: requests.Response) -> bytes:
+    """Read a streamed page only as far as the ``</script>`` that closes the async payload."""
+    buffer = bytearray()
+    marker_at = -1
+    for chunk in response.iter_content(DETAIL_CHUNK_SIZE):
+        # Re-scan a small overlap so markers split across chunks are still found.
+        scan_from = max(len(buffer) - len(ASYNC_DATA_MARKER), 0)
+        buffer += chunk
+        if marker_at == -1:
+            marker_at = buffer.find(ASYNC_DATA_MARKER, scan_from)
+            if marker_at == -1:
+                continue
+            scan_from = marker_at
+        if buffer.find(SCRIPT_END, max(scan_from, marker_at)) != -1:
+            break
+    return bytes(buffer)
+
+
 def _iter_containers(data: list) -> Iterable[dict]:
     for item in data:
         if isinstance(item, dict):
@@ -122,7 +163,7 @@ def _iter_containers(data: list) -> Iterable[dict]:
                             yield element
 
 
-def _parse_announcements(html: str) -> list[AnnouncementSummary]:
+def _parse_announcements(html: bytes) -> list[AnnouncementSummary]:
     payload = _extract_async_payload(html)
     summaries: list[AnnouncementSummary] = []
     for container in _iter_containers(payload):
@@ -154,11 +195,10 @@ def _parse_announcements(html: str) -> list[AnnouncementSummary]:
                     announce_type=announce_type,
                 )
             )
-    summaries.sort(key=lambda entry: entry.begin_time)
     return summaries
 
 
-def _parse_detail(html: str, summary: AnnouncementSummary) -> AnnouncementDetail:
+def _parse_detail(html: bytes, summary: AnnouncementSummary) -> AnnouncementDetail:
     payload = _extract_async_payload(html)
     content_html: str | None = None
     for container in _iter_containers(payload):
@@ -181,7 +221,8 @@ class TencentCloudCollector:
         list_url: str | None = None,
         state_path: Path | None = None,
     ) -> None:
-        self.session = session or requests.Session()
+        # Pooled for the concurrent detail fetches; run() reuses it for ingest.
+        self.session = session or pooled_session()
         self.list_url = list_url or DEFAULT_LIST_URL
         self.state_path = state_path or Path(__file__).resolve().with_name(STATE_FILE_NAME)
         self.session.headers.update(
@@ -216,23 +257,31 @@ class TencentCloudCollector:
     def fetch_summaries(self) -> Sequence[AnnouncementSummary]:
         response = self.session.get(self.list_url, timeout=30)
         response.raise_for_status()
-        html = response.text
-        summaries = _parse_announcements(html)
-        return summaries
+        return _parse_announcements(response.content)
 
     def fetch_detail(self, summary: AnnouncementSummary) -> AnnouncementDetail:
-        detail_url = DETAIL_URL_TEMPLATE.format(announce_id=summary.announce_id)
-        response = self.session.get(detail_url, timeout=30)
-        response.raise_for_status()
-        html = response.text
+        response = self.session.get(summary.origin_url, timeout=30, stream=True)
+        try:
+            response.raise_for_status()
+            # The rest of the page after the payload's </script> is never downloaded.
+            html = _read_until_async_payload(response)
+        finally:
+            response.close()
         return _parse_detail(html, summary)
 
+    def _prefetch_details(self, summaries: Sequence[AnnouncementSummary]) -> list[AnnouncementDetail]:
+        """Fetch announcement details concurrently, returning results aligned with ``summaries``."""
+        if not summaries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(summaries))) as executor:
+            return list(executor.map(self.fetch_detail, summaries))
+
     # --- Normalize ------------------------------------------------------
     def normalize(self, detail: AnnouncementDetail) -> BulletinCreate:
         summary = detail.summary
         content_html = detail.content_html
         body_text = _html_to_text(content_html)
-        origin_url = DETAIL_URL_TEMPLATE.format(announce_id=summary.announce_id)
+        origin_url = summary.origin_url
 
         source = SourceInfo(
             source_slug="tencent_cloud_security",
@@ -301,20 +350,23 @@ class TencentCloudCollector:
     def collect(self, *, limit: int | None = None, force: bool = False) -> List[BulletinCreate]:
         limit = limit or DEFAULT_LIMIT
         cursor = None if force else self.load_cursor()
-        summaries = list(self.fetch_summaries())
-
-        selected: list[AnnouncementSummary] = []
-        for summary in summaries:
-            if cursor and summary.begin_time <= cursor:
-                continue
-            selected.append(summary)
-        if limit is not None and limit > 0:
-            selected = selected[-limit:]
+        candidates = [
+            (summary.begin_time, index, summary)
+            for index, summary in enumerate(self.fetch_summaries())
+            if not cursor or summary.begin_time > cursor
+        ]
+        # Only the newest ``limit`` entries are kept, so a bounded heap replaces a full sort.
+        # The list index breaks ties exactly like the previous stable sort did.
+        if limit > 0:
+            newest = heapq.nlargest(limit, candidates)
+            newest.reverse()
+        else:
+            newest = sorted(candidates)
+        selected = [summary for _, _, summary in newest]
 
         bulletins: list[BulletinCreate] = []
         latest = cursor
-        for summary in selected:
-            detail = self.fetch_detail(summary)
+        for summary, detail in zip(selected, self._prefetch_details(selected)):
             bulletin = self.normalize(detail)
             bulletins.append(bulletin)
             if latest is None or summary.begin_time > latest:
@@ -338,13 +390,10 @@ def run(
     bulletins = collector.collect(limit=limit, force=force)
     response_data = None
     if ingest_url and bulletins:
-        session = requests.Session()
-        headers = {"Content-Type": "application/json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        session.headers.update(headers)
-        payload = [b.model_dump(mode="json") for b in bulletins]
-        response = session.post(ingest_url, json=payload, timeout=30)
+        headers = ingest_headers(token)
+        response = collector.session.post(
+            ingest_url, data=encode_bulletins(bulletins), headers=headers, timeout=30
+        )
         response.raise_for_status()
         try:
             response_data = response.json()
@@ -1,10 +1,12 @@
 """Tests for the Tencent Cloud security announcement plugin."""
 from __future__ import annotations
 
+from datetime import datetime, timezone
 from pathlib import Path
 
 import pytest
 
+from resources.tencent_cloud_security import collector as collector_module
 from resources.tencent_cloud_security.collector import (
     DEFAULT_LIST_URL,
     DETAIL_URL_TEMPLATE,
@@ -18,6 +20,7 @@ class MockResponse:
     def __init__(self, *, text: str, status_code: int = 200):
         self._text = text
         self.status_code = status_code
+        self.consumed = 0
 
     def raise_for_status(self) -> None:
         if not (200 <= self.status_code < 300):
@@ -27,13 +30,26 @@ class MockResponse:
     def text(self) -> str:
         return self._text
 
+    @property
+    def content(self) -> bytes:
+        return self._text.encode("utf-8")
+
+    def iter_content(self, chunk_size: int = 1):
+        data = self._text.encode("utf-8")
+        for start in range(0, len(data), chunk_size):
+            self.consumed = start + chunk_size
+            yield data[start : start + chunk_size]
+
+    def close(self) -> None:
+        pass
+
 
 class FakeSession:
     def __init__(self, responses: dict[str, MockResponse]):
         self._responses = responses
         self.headers: dict[str, str] = {}
 
-    def get(self, url: str, timeout: int = 30) -> MockResponse:
+    def get(self, url: str, timeout: int = 30, stream: bool = False) -> MockResponse:
         try:
             return self._responses[url]
         except KeyError as exc:
@@ -105,3 +121,45 @@ def test_cursor_prevents_duplicate_processing(tmp_path, list_html, detail_html_3
     collector_second = TencentCloudCollector(session=session_second, state_path=state_path)
     second_run = collector_second.collect(force=False)
     assert second_run == []
+
+
+def test_fetch_detail_stops_after_async_payload(monkeypatch, tmp_path, list_html, detail_html_3001):
+    monkeypatch.setattr(collector_module, "DETAIL_CHUNK_SIZE", 16)
+    detail_url_3001 = DETAIL_URL_TEMPLATE.format(announce_id="3001")
+    detail_response = MockResponse(text=detail_html_3001 + "<footer>" + "x" * 4096 + "</footer>")
+    session = FakeSession(
+        {
+            DEFAULT_LIST_URL: MockResponse(text=list_html),
+            detail_url_3001: detail_response,
+        }
+    )
+    collector = TencentCloudCollector(session=session, state_path=tmp_path / "cursor.txt")
+
+    bulletins = collector.collect(limit=1, force=True)
+
+    assert bulletins[0].content.body_text.startswith("这里是公告内容")
+    assert detail_response.consumed < len(detail_html_3001.encode("utf-8"))
+
+
+def test_html_to_text_matches_stdlib_fallback(monkeypatch):
+    html = "&lt;p&gt;公告内容，包含&lt;strong&gt;加固建议&lt;/strong&gt;。&lt;/p&gt;&lt;ul&gt;&lt;li&gt;1&lt;/li&gt;&lt;/ul&gt;"
+    fast = collector_module._html_to_text(html)
+    monkeypatch.setattr(collector_module, "LexborHTMLParser", None)
+    assert fast == collector_module._html_to_text(html) == "公告内容，包含 加固建议 。 1"
+
+
+def test_extract_async_payload_stops_at_its_script():
+    html = (
+        b"<script>window['__ASYNC_DATA__'] = [[], {\"a\": [1]}];</script>"
+        b"<script>var later = [2, 3];</script>"
+    )
+    assert collector_module._extract_async_payload(html) == [[], {"a": [1]}]
+    with pytest.raises(ValueError):
+        collector_module._extract_async_payload(b"<html></html>")
+
+
+def test_parse_datetime_fast_path_matches_strptime():
+    expected = datetime(2025, 3, 4, 1, 6, 7, tzinfo=timezone.utc)
+    assert collector_module._parse_datetime("2025-03-04 09:06:07") == expected
+    assert collector_module._parse_datetime("2025-3-4 9:06:07") == expected
+    assert collector_module._parse_datetime("2025-13-04 09:06:07") is None
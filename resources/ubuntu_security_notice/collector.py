@@ -1,24 +1,43 @@
 """Ubuntu security notices collector plugin."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, List, Sequence
+from typing import IO, Iterable, List, Sequence
 import json
 import logging
 import xml.etree.ElementTree as ET
 
 import requests
 
+try:  # Optional fast JSON codec for notice details and their disk cache.
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore
+
+from app.collector_utils import (
+    decoded_stream,
+    encode_bulletins,
+    ingest_headers,
+    iter_xml_items,
+    load_validators,
+    pooled_session,
+    save_validators,
+)
 from app.schemas import BulletinCreate, ContentInfo, SourceInfo
 from app.time_utils import resolve_published_at
 
 LOGGER = logging.getLogger(__name__)
 USER_AGENT = "SecLensUbuntuCollector/1.0"
 DEFAULT_LIMIT = 20
+DETAIL_FETCH_WORKERS = 8
 SOURCE_FILE = Path(__file__).resolve().with_name("source.txt")
 STATE_FILE_NAME = ".cursor"
+DETAIL_CACHE_DIR_NAME = "detail_cache"
+DETAIL_CACHE_LIMIT = 256
+FEED_VALIDATORS_FILE_NAME = ".feed_validators.json"
 
 
 @dataclass
@@ -50,6 +69,40 @@ def _clean_text(value: str | None) -> str | None:
     return " ".join(value.split()).strip() or None
 
 
+class _PrefixedStream:
+    """Read-only file object that replays ``prefix`` before the rest of ``stream``."""
+
+    def __init__(self, prefix: bytes, stream: IO[bytes]) -> None:
+        self._prefix = prefix
+        self._stream = stream
+
+    def read(self, size: int = -1) -> bytes:
+        if not self._prefix:
+            return self._stream.read(size)
+        if size is None or size < 0:
+            data, self._prefix = self._prefix + self._stream.read(), b""
+            return data
+        data, self._prefix = self._prefix[:size], self._prefix[size:]
+        return data
+
+
+def _skip_leading_whitespace(stream: IO[bytes], chunk_size: int = 1024) -> IO[bytes]:
+    """Drop whitespace before the XML declaration, which XML parsers reject."""
+    while True:
+        chunk = stream.read(chunk_size)
+        stripped = chunk.lstrip()
+        if stripped or not chunk:
+            return _PrefixedStream(stripped, stream)  # type: ignore[return-value]
+
+
+def _item_fields(item: ET.Element) -> dict[str, str | None]:
+    """Map child tag to text in one pass, keeping the first occurrence like ``findtext``."""
+    fields: dict[str, str | None] = {}
+    for child in item:
+        fields.setdefault(child.tag, child.text)
+    return fields
+
+
 class UbuntuSecurityCollector:
     """Encapsulates fetch, normalize, and cursor persistence for Ubuntu USN notices."""
 
@@ -59,10 +112,17 @@ class UbuntuSecurityCollector:
         session: requests.Session | None = None,
         feed_url: str | None = None,
         state_path: Path | None = None,
+        force_refresh: bool = False,
     ) -> None:
-        self.session = session or requests.Session()
+        # Keep-alive pool for the per-notice detail requests; run() reuses it for ingest.
+        self.session = session or pooled_session(status_forcelist=(429, 502, 503, 504))
         self.feed_url = feed_url or _load_feed_url()
         self.state_path = state_path or Path(__file__).resolve().with_name(STATE_FILE_NAME)
+        # Published USN detail documents do not change, so they are cached per notice id.
+        self.detail_cache_dir = self.state_path.with_name(DETAIL_CACHE_DIR_NAME)
+        self.force_refresh = force_refresh
+        self.feed_validators_path = self.state_path.with_name(FEED_VALIDATORS_FILE_NAME)
+        self._feed_validators: dict[str, str] = {}
         self.session.headers.update(
             {
                 "User-Agent": USER_AGENT,
@@ -91,68 +151,151 @@ class UbuntuSecurityCollector:
         value = value.astimezone(timezone.utc)
         self.state_path.write_text(value.isoformat(), encoding="utf-8")
 
+    def load_feed_validators(self) -> dict[str, str]:
+        """Load the feed's ETag / Last-Modified from the previous run."""
+        return load_validators(self.feed_validators_path)
+
+    def save_feed_validators(self) -> None:
+        """Persist the validators of the last successfully processed feed response."""
+        save_validators(self.feed_validators_path, self._feed_validators)
+
     # --- Fetch ----------------------------------------------------------
-    def fetch_feed(self) -> Sequence[FeedEntry]:
-        response = self.session.get(self.feed_url, timeout=30)
-        response.raise_for_status()
-        text = response.text.lstrip()
+    def fetch_feed(self, *, revalidate: bool = True) -> Sequence[FeedEntry]:
+        """Fetch and parse the RSS feed.
+
+        With ``revalidate`` the request carries the stored ETag /
+        Last-Modified and an unchanged feed (304 Not Modified) returns no entries.
+        """
+        headers: dict[str, str] = {}
+        if revalidate:
+            validators = self.load_feed_validators()
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        response = self.session.get(self.feed_url, timeout=30, headers=headers or None, stream=True)
         try:
-            root = ET.fromstring(text)
-        except ET.ParseError as exc:
-            raise ValueError("Failed to parse Ubuntu RSS feed") from exc
-
-        entries: list[FeedEntry] = []
-        for item in root.findall("./channel/item"):
-            link = (item.findtext("link") or "").strip()
-            if not link:
-                continue
-            notice_id = self._extract_notice_id(link)
-            title = _clean_text(item.findtext("title")) or notice_id
-            summary = _clean_text(item.findtext("description"))
-            fetched_at = datetime.now(timezone.utc)
-            raw_pub_date = item.findtext("pubDate")
-            pub_date, time_meta = resolve_published_at(
-                "ubuntu_security",
-                [(raw_pub_date, "item.pubDate")],
-                fetched_at=fetched_at,
-            )
-            guid = _clean_text(item.findtext("guid"))
-            entries.append(
-                FeedEntry(
-                    notice_id=notice_id,
-                    title=title,
-                    link=link,
-                    summary=summary,
-                    published_at=pub_date or fetched_at,
-                    guid=guid,
-                    fetched_at=fetched_at,
-                    time_meta=time_meta if time_meta else None,
-                    raw_pub_date=raw_pub_date.strip() if isinstance(raw_pub_date, str) else None,
-                )
-            )
-        return entries
+            if response.status_code == 304:
+                return []
+            response.raise_for_status()
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            self._feed_validators = {
+                key: value for key, value in (("etag", etag), ("last_modified", last_modified)) if value
+            }
+            entries: list[FeedEntry] = []
+            try:
+                for item in iter_xml_items(_skip_leading_whitespace(decoded_stream(response))):
+                    fields = _item_fields(item)
+                    link = (fields.get("link") or "").strip()
+                    if not link:
+                        continue
+                    notice_id = self._extract_notice_id(link)
+                    title = _clean_text(fields.get("title")) or notice_id
+                    summary = _clean_text(fields.get("description"))
+                    fetched_at = datetime.now(timezone.utc)
+                    raw_pub_date = fields.get("pubDate")
+                    pub_date, time_meta = resolve_published_at(
+                        "ubuntu_security",
+                        [(raw_pub_date, "item.pubDate")],
+                        fetched_at=fetched_at,
+                    )
+                    guid = _clean_text(fields.get("guid"))
+                    entries.append(
+                        FeedEntry(
+                            notice_id=notice_id,
+                            title=title,
+                            link=link,
+                            summary=summary,
+                            published_at=pub_date or fetched_at,
+                            guid=guid,
+                            fetched_at=fetched_at,
+                            time_meta=time_meta if time_meta else None,
+                            raw_pub_date=raw_pub_date.strip() if isinstance(raw_pub_date, str) else None,
+                        )
+                    )
+            except SyntaxError as exc:  # ElementTree.ParseError and lxml XMLSyntaxError
+                raise ValueError("Failed to parse Ubuntu RSS feed") from exc
+            return entries
+        finally:
+            response.close()
 
     def fetch_detail(self, notice_id: str, link: str) -> dict:
+        cache_file = self.detail_cache_dir / f"{notice_id}.json"
+        if not self.force_refresh:
+            cached = self._load_cached_detail(cache_file)
+            if cached is not None:
+                return cached
         detail_url = f"{link}.json" if not link.endswith(".json") else link
         response = self.session.get(detail_url, timeout=30)
         response.raise_for_status()
-        return response.json()
+        detail = orjson.loads(response.content) if orjson is not None else response.json()
+        self._store_cached_detail(cache_file, detail)
+        return detail
+
+    @staticmethod
+    def _load_cached_detail(cache_file: Path) -> dict | None:
+        try:
+            content = cache_file.read_bytes()
+            detail = orjson.loads(content) if orjson is not None else json.loads(content)
+        except FileNotFoundError:
+            return None
+        except ValueError:
+            LOGGER.warning("Ignoring unreadable detail cache %s", cache_file)
+            return None
+        return detail if isinstance(detail, dict) else None
+
+    @staticmethod
+    def _store_cached_detail(cache_file: Path, detail: dict) -> None:
+        # Write then rename so an interrupted run never leaves a truncated cache file.
+        tmp_file = cache_file.with_name(cache_file.name + ".tmp")
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            if orjson is not None:
+                tmp_file.write_bytes(orjson.dumps(detail))
+            else:
+                tmp_file.write_text(json.dumps(detail), encoding="utf-8")
+            tmp_file.replace(cache_file)
+        except OSError as exc:
+            LOGGER.warning("Failed to cache Ubuntu notice detail %s: %s", cache_file, exc)
+
+    def _prefetch_details(self, entries: Sequence[FeedEntry]) -> list[dict]:
+        """Fetch notice details concurrently, returning results aligned with ``entries``."""
+        if not entries:
+            return []
+        with ThreadPoolExecutor(max_workers=min(DETAIL_FETCH_WORKERS, len(entries))) as executor:
+            details = list(executor.map(lambda entry: self.fetch_detail(entry.notice_id, entry.link), entries))
+        self._prune_detail_cache()
+        return details
+
+    def _prune_detail_cache(self) -> None:
+        """Keep only the ``DETAIL_CACHE_LIMIT`` most recently written notice details."""
+        try:
+            cache_files = sorted(self.detail_cache_dir.glob("*.json"), key=lambda path: path.stat().st_mtime)
+            for stale in cache_files[:-DETAIL_CACHE_LIMIT]:
+                stale.unlink(missing_ok=True)
+        except OSError as exc:
+            LOGGER.warning("Failed to prune Ubuntu detail cache %s: %s", self.detail_cache_dir, exc)
 
     # --- Normalize ------------------------------------------------------
     def normalize(self, entry: FeedEntry, detail: dict) -> BulletinCreate:
         summary = _clean_text(detail.get("summary")) or entry.summary
         body_text = detail.get("description") or summary
         published = detail.get("published")
-        candidates = [
-            (published, "detail.published"),
-            (entry.published_at, "entry.published_at"),
-            (entry.raw_pub_date, "feed.pubDate"),
-        ]
-        published_at, time_meta = resolve_published_at(
-            "ubuntu_security",
-            candidates,
-            fetched_at=entry.fetched_at,
-        )
+        if published:
+            candidates = [
+                (published, "detail.published"),
+                (entry.published_at, "entry.published_at"),
+                (entry.raw_pub_date, "feed.pubDate"),
+            ]
+            published_at, time_meta = resolve_published_at(
+                "ubuntu_security",
+                candidates,
+                fetched_at=entry.fetched_at,
+            )
+        else:
+            # The detail adds no date: keep what fetch_feed already resolved from pubDate.
+            published_at, time_meta = entry.published_at, entry.time_meta
 
         source = SourceInfo(
             source_slug="ubuntu_security",
@@ -221,7 +364,9 @@ class UbuntuSecurityCollector:
     def collect(self, *, limit: int | None = None, force: bool = False) -> List[BulletinCreate]:
         limit = limit or DEFAULT_LIMIT
         cursor = None if force else self.load_cursor()
-        entries = list(self.fetch_feed())
+        entries = list(self.fetch_feed(revalidate=not force))
+        if not entries:
+            return []
         entries.sort(key=lambda item: item.published_at)
 
         selected: list[FeedEntry] = []
@@ -234,8 +379,7 @@ class UbuntuSecurityCollector:
 
         bulletins: list[BulletinCreate] = []
         latest = cursor
-        for entry in selected:
-            detail = self.fetch_detail(entry.notice_id, entry.link)
+        for entry, detail in zip(selected, self._prefetch_details(selected)):
             bulletin = self.normalize(entry, detail)
             bulletins.append(bulletin)
             if latest is None or entry.published_at > latest:
@@ -243,6 +387,8 @@ class UbuntuSecurityCollector:
 
         if latest and not force and bulletins:
             self.save_cursor(latest)
+        if self._feed_validators:
+            self.save_feed_validators()
         return bulletins
 
     # --- Helpers --------------------------------------------------------
@@ -265,13 +411,10 @@ def run(
     bulletins = collector.collect(limit=limit, force=force)
     response_data = None
     if ingest_url and bulletins:
-        session = requests.Session()
-        headers = {"Content-Type": "application/json"}
-        if token:
-            headers["Authorization"] = f"Bearer {token}"
-        session.headers.update(headers)
-        payload = [b.model_dump(mode="json") for b in bulletins]
-        response = session.post(ingest_url, json=payload, timeout=30)
+        headers = ingest_headers(token)
+        response = collector.session.post(
+            ingest_url, data=encode_bulletins(bulletins), headers=headers, timeout=30
+        )
         response.raise_for_status()
         try:
             response_data = response.json()
@@ -0,0 +1,80 @@
+import io
+import json
+from datetime import datetime, timezone
+from unittest.mock import Mock
+
+import pytest
+from requests.adapters import HTTPAdapter
+
+from app.collector_utils import (
+    encode_bulletins,
+    ingest_headers,
+    iter_xml_items,
+    load_json,
+    load_validators,
+    pooled_session,
+    save_validators,
+)
+from app.schemas import BulletinCreate, ContentInfo, SourceInfo
+
+
+def _bulletin(external_id: str) -> BulletinCreate:
+    return BulletinCreate(
+        source=SourceInfo(source_slug="example", external_id=external_id),
+        content=ContentInfo(title=f"Advisory {external_id}"),
+        fetched_at=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    )
+
+
+def test_encode_bulletins_matches_model_dump():
+    bulletins = [_bulletin("a"), _bulletin("b")]
+
+    assert json.loads(encode_bulletins(bulletins)) == [item.model_dump(mode="json") for item in bulletins]
+
+
+def test_encode_bulletins_can_exclude_none():
+    payload = json.loads(encode_bulletins((_bulletin("a"),), exclude_none=True))
+
+    assert payload == [_bulletin("a").model_dump(mode="json", exclude_none=True)]
+    assert "severity" not in payload[0]
+
+
+def test_pooled_session_mounts_retrying_adapter():
+    session = pooled_session(pool_connections=2, status_forcelist=(503,))
+
+    adapter = session.get_adapter("https://example.com")
+    assert isinstance(adapter, HTTPAdapter)
+    assert adapter.max_retries.total == 3
+    assert adapter.max_retries.status_forcelist == (503,)
+
+
+def test_ingest_headers_only_add_authorization_with_token():
+    assert "Authorization" not in ingest_headers(None)
+    assert ingest_headers("secret")["Authorization"] == "Bearer secret"
+
+
+def test_validators_round_trip(tmp_path):
+    path = tmp_path / "validators.json"
+    assert load_validators(path) == {}
+    assert load_validators(None) == {}
+
+    save_validators(path, {"etag": '"v1"'})
+    assert load_validators(path) == {"etag": '"v1"'}
+
+    path.write_text("not json", encoding="utf-8")
+    assert load_validators(path) == {}
+
+
+def test_load_json_decodes_response_bytes():
+    assert load_json(Mock(content='{"title": "é"}'.encode("utf-8"))) == {"title": "é"}
+
+
+def test_iter_xml_items_streams_items():
+    feed = io.BytesIO(b"<rss><channel><item><title>a</title></item><item><title>b</title></item></channel></rss>")
+
+    assert [item.findtext("title") for item in iter_xml_items(feed)] == ["a", "b"]
+
+
+def test_iter_xml_items_raises_on_malformed_feed():
+    with pytest.raises(SyntaxError):
+        list(iter_xml_items(io.BytesIO(b"<rss><channel><item><title>cut")))
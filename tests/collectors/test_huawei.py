@@ -27,3 +27,20 @@ def test_normalize_huawei_record():
     assert bulletin.labels and "Critical" in bulletin.labels
     assert bulletin.topics and "official_bulletin" in bulletin.topics
     assert bulletin.extra and bulletin.extra.get("sasn_no") == sample["sasnNo"]
+
+
+def test_encode_bulletins_matches_pydantic_json():
+    import json
+
+    from app.collector_utils import encode_bulletins
+
+    bulletin = HuaweiCollector().normalize(
+        {
+            "title": "Example advisory",
+            "advisoryUrl": "https://securitybulletin.huawei.com/example",
+            "publishDate": "2025-09-10",
+            "vul": [{"cveId": "CVE-2024-38821"}],
+        }
+    )
+
+    assert json.loads(encode_bulletins([bulletin])) == [bulletin.model_dump(mode="json")]
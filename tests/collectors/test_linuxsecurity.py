@@ -1,4 +1,29 @@
-from resources.linuxsecurity_hybrid.collector import LinuxSecurityCollector
+import io
+from unittest.mock import Mock
+
+from resources.linuxsecurity_hybrid.collector import FetchParams, LinuxSecurityCollector
+
+FEED_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<rss version="2.0" xmlns:content="http://purl.org/rss/1.0/modules/content/">
+  <channel>
+    <title>LinuxSecurity</title>
+    <item>
+      <title>First Advisory</title>
+      <link>https://linuxsecurity.com/advisories/vendor/1</link>
+      <description>First summary</description>
+      <content:encoded><![CDATA[<p>First body</p>]]></content:encoded>
+      <guid isPermaLink="false">vendor-1</guid>
+      <pubDate>Wed, 08 Jan 2025 15:30:00 GMT</pubDate>
+      <category>Advisories</category>
+    </item>
+    <item>
+      <title>Second Advisory</title>
+      <link>https://linuxsecurity.com/advisories/vendor/2</link>
+      <guid>vendor-2</guid>
+    </item>
+  </channel>
+</rss>
+"""
 
 
 def test_normalize_linuxsecurity_hybrid_item():
@@ -24,3 +49,58 @@ def test_normalize_linuxsecurity_hybrid_item():
     assert bulletin.content.published_at is not None
     assert "category:advisories" in bulletin.labels
     assert bulletin.topics == ["security-news"]
+
+
+def test_fetch_streams_items_up_to_limit():
+    response = Mock(status_code=200, headers={})
+    response.raw = io.BytesIO(FEED_XML)
+    session = Mock()
+    session.headers = {}
+    session.get.return_value = response
+
+    collector = LinuxSecurityCollector(session=session)
+    items = collector.fetch(FetchParams(limit=1))
+
+    assert len(items) == 1
+    item = items[0]
+    assert item["title"] == "First Advisory"
+    assert item["content_encoded"] == "<p>First body</p>"
+    assert item["guid_attributes"] == {"isPermaLink": "false"}
+    assert item["categories"] == ["Advisories"]
+    assert item["raw_xml"].startswith("<item")
+    assert session.get.call_args.kwargs["stream"] is True
+    response.close.assert_called_once()
+
+
+def test_fetch_uses_conditional_get(tmp_path):
+    validators_path = tmp_path / "validators.json"
+    response = Mock(status_code=200, headers={"Last-Modified": "Wed, 08 Jan 2025 15:30:00 GMT"})
+    response.raw = io.BytesIO(FEED_XML)
+    session = Mock()
+    session.headers = {}
+    session.get.return_value = response
+
+    first = LinuxSecurityCollector(session=session, validators_path=validators_path)
+    assert len(first.collect()) == 2
+    assert not validators_path.exists()  # saved by run() only after ingest succeeds
+    first.save_validators()
+
+    session.get.return_value = Mock(status_code=304)
+    collector = LinuxSecurityCollector(session=session, validators_path=validators_path)
+    assert collector.collect() == []
+    assert session.get.call_args.kwargs["headers"] == {"If-Modified-Since": "Wed, 08 Jan 2025 15:30:00 GMT"}
+
+
+def test_limited_fetch_does_not_record_validators(tmp_path):
+    validators_path = tmp_path / "validators.json"
+    response = Mock(status_code=200, headers={"ETag": '"v1"'})
+    response.raw = io.BytesIO(FEED_XML)
+    session = Mock()
+    session.headers = {}
+    session.get.return_value = response
+
+    collector = LinuxSecurityCollector(session=session, validators_path=validators_path)
+    assert len(collector.collect(FetchParams(limit=1))) == 1
+    collector.save_validators()
+
+    assert LinuxSecurityCollector(session=session, validators_path=validators_path).load_validators() == {}
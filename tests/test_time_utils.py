@@ -47,3 +47,18 @@ def test_resolve_numeric_timestamp():
     assert published_at == target
     assert meta["applied_timezone"] == "UTC"
     assert meta.get("fallback") is False
+
+
+def test_resolve_repeated_strings_reuse_parse_cache():
+    from app.time_utils import _parse_datetime_string
+
+    _parse_datetime_string.cache_clear()
+    fetched_at = datetime(2025, 9, 11, 0, 0, 0, tzinfo=timezone.utc)
+    results = [
+        resolve_published_at("huawei_security", [("2025-09-10", "item.publishDate")], fetched_at=fetched_at)
+        for _ in range(3)
+    ]
+
+    assert all(result == results[0] for result in results)
+    assert results[0][1]["date_only"] is True
+    assert _parse_datetime_string.cache_info().hits == 2